@@ -22,6 +22,35 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Old status -> new status (underscored names for SQLAlchemy enum compatibility).
+# pending -> ready_for_classification (needs classification)
+# downloaded -> ready_for_extraction (already downloaded, skip to extraction)
+# processed -> extracted
+# failed -> failed_in_download (most common failure point)
+# ignored -> discarded
+_STATUS_UPGRADES = (
+    ('pending', 'ready_for_classification'),
+    ('downloaded', 'ready_for_extraction'),
+    ('processed', 'extracted'),
+    ('failed', 'failed_in_download'),
+    ('ignored', 'discarded'),
+)
+
+_STATUS_DOWNGRADES = (
+    ('ready_for_classification', 'pending'),
+    ('ready_for_download', 'pending'),
+    ('ready_for_extraction', 'downloaded'),
+    ('extracted', 'processed'),
+    ('failed_in_download', 'failed'),
+    ('failed_in_extraction', 'failed'),
+    ('discarded', 'ignored'),
+)
+
+_RENAME_STATUS = sa.text(
+    "UPDATE source_google_news SET status = :new WHERE status = :old"
+)
+
+
 def upgrade() -> None:
     """Add classification fields and migrate status values."""
     
@@ -36,11 +65,6 @@ def upgrade() -> None:
         batch_op.add_column(
             sa.Column('classification_reasoning', sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True)
         )
-        batch_op.create_index(
-            batch_op.f('ix_source_google_news_is_violent_death'), 
-            ['is_violent_death'], 
-            unique=False
-        )
     
     # Migrate existing status values to new names (using underscores for SQLAlchemy enum compatibility)
     # Old: pending, downloaded, processed, failed, ignored
@@ -48,46 +72,30 @@ def upgrade() -> None:
     #      extracted, failed_in_download, failed_in_extraction, discarded
     
     conn = op.get_bind()
-    
-    # Map old status values to new ones
-    # pending -> ready_for_classification (needs classification)
-    # downloaded -> ready_for_extraction (already downloaded, skip to extraction)
-    # processed -> extracted
-    # failed -> failed_in_download (most common failure point)
-    # ignored -> discarded
-    
-    conn.execute(sa.text("""
-        UPDATE source_google_news 
-        SET status = CASE status
-            WHEN 'pending' THEN 'ready_for_classification'
-            WHEN 'downloaded' THEN 'ready_for_extraction'
-            WHEN 'processed' THEN 'extracted'
-            WHEN 'failed' THEN 'failed_in_download'
-            WHEN 'ignored' THEN 'discarded'
-            ELSE status
-        END
-    """))
+
+    # One UPDATE per old value, so each statement only touches its matching rows
+    # through ix_source_google_news_status instead of rewriting the whole table.
+    for old_status, new_status in _STATUS_UPGRADES:
+        conn.execute(_RENAME_STATUS, {"old": old_status, "new": new_status})
+
+    # Index after the backfill: on Postgres every updated row version would
+    # otherwise also be written into this index.
+    with op.batch_alter_table('source_google_news', schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f('ix_source_google_news_is_violent_death'),
+            ['is_violent_death'],
+            unique=False
+        )
 
 
 def downgrade() -> None:
     """Remove classification fields and revert status values."""
     
     conn = op.get_bind()
-    
+
     # Revert status values to old names
-    conn.execute(sa.text("""
-        UPDATE source_google_news 
-        SET status = CASE status
-            WHEN 'ready_for_classification' THEN 'pending'
-            WHEN 'ready_for_download' THEN 'pending'
-            WHEN 'ready_for_extraction' THEN 'downloaded'
-            WHEN 'extracted' THEN 'processed'
-            WHEN 'failed_in_download' THEN 'failed'
-            WHEN 'failed_in_extraction' THEN 'failed'
-            WHEN 'discarded' THEN 'ignored'
-            ELSE status
-        END
-    """))
+    for new_status, old_status in _STATUS_DOWNGRADES:
+        conn.execute(_RENAME_STATUS, {"old": new_status, "new": old_status})
     
     # Remove classification columns
     with op.batch_alter_table('source_google_news', schema=None) as batch_op:
@@ -0,0 +1,36 @@
+"""add_source_status_id_index
+
+Revision ID: i8j9k0l1m2n3
+Revises: h7i8j9k0l1m2
+Create Date: 2026-10-18 10:00:00.000000
+
+Adds a composite (status, id) index on source_google_news so the classify,
+download and extract queue pops (WHERE status = ... ORDER BY id LIMIT n) are a
+single index range scan instead of a status lookup plus sort.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "i8j9k0l1m2n3"
+down_revision: Union[str, Sequence[str], None] = "h7i8j9k0l1m2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = "ix_source_google_news_status_id"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # Build without blocking ingestion writes on the live table.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _INDEX, "source_google_news", ["status", "id"], postgresql_concurrently=True
+            )
+    else:
+        op.create_index(_INDEX, "source_google_news", ["status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name="source_google_news")
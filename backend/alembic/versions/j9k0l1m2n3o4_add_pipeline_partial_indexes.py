@@ -0,0 +1,42 @@
+"""add_pipeline_partial_indexes
+
+Revision ID: j9k0l1m2n3o4
+Revises: i8j9k0l1m2n3
+Create Date: 2026-10-18 11:00:00.000000
+
+Adds partial indexes covering only the actionable rows of the batch queues:
+pending raw_event rows (ordered by event_date for batch dedup) and unique_event
+rows still flagged needs_enrichment. Both dialects support partial indexes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "j9k0l1m2n3o4"
+down_revision: Union[str, Sequence[str], None] = "i8j9k0l1m2n3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, predicate)
+_PARTIAL_INDEXES = [
+    ("ix_raw_event_dedup_pending", "raw_event", ["event_date"], "deduplication_status = 'pending'"),
+    ("ix_unique_event_needs_enrichment_partial", "unique_event", ["id"], "needs_enrichment = true"),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, predicate in _PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            sqlite_where=sa.text(predicate),
+            postgresql_where=sa.text(predicate),
+        )
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(_PARTIAL_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -77,8 +77,11 @@ def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
 
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
 def _is_bcrypt_hash(value: str) -> bool:
-    return value.startswith("$2a$") or value.startswith("$2b$") or value.startswith("$2y$")
+    return value.startswith(_BCRYPT_PREFIXES)
 
 
 def _verify_credential(plain_password: str, stored_value: str) -> bool:
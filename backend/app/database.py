@@ -5,29 +5,33 @@ from functools import lru_cache
 from pathlib import Path
 
 from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import get_settings
 
+_SQLITE_PREFIX = "sqlite+aiosqlite:///"
+
 
 def _normalize_database_url(db_url: str) -> str:
     """Normalize database URL to ensure the correct async driver is used."""
     if db_url.startswith("sqlite:///"):
-        db_url = db_url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+        db_url = db_url.replace("sqlite:///", _SQLITE_PREFIX, 1)
 
     if db_url.startswith("postgresql://"):
         db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
     elif db_url.startswith("postgres://"):
         db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
 
-    if db_url.startswith("sqlite+aiosqlite:///"):
-        path_part = db_url.split("sqlite+aiosqlite:///")[-1]
-        if path_part and not path_part.startswith("/"):
-            abs_path = (Path.cwd() / path_part).resolve()
-            abs_path.parent.mkdir(parents=True, exist_ok=True)
-            db_url = f"sqlite+aiosqlite:///{abs_path}"
+    if db_url.startswith(_SQLITE_PREFIX):
+        # Keep query options (e.g. ?mode=ro) out of the filesystem path.
+        path_part, sep, query = db_url[len(_SQLITE_PREFIX):].partition("?")
+        if path_part and path_part != ":memory:" and not path_part.startswith("/"):
+            abs_path = (Path.cwd() / Path(path_part).expanduser()).resolve()
+            if not abs_path.parent.is_dir():
+                abs_path.parent.mkdir(parents=True, exist_ok=True)
+            db_url = f"{_SQLITE_PREFIX}{abs_path}{sep}{query}"
 
     return db_url
 
@@ -51,6 +55,10 @@ def _set_sqlite_pragmas(dbapi_connection, connection_record):
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.execute("PRAGMA temp_store=MEMORY")
+    # 64 MiB page cache (negative = KiB) and 256 MiB of memory-mapped reads, so
+    # the hot pipeline tables stay resident instead of the 2 MiB default cache.
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
     cursor.close()
 
 
@@ -84,6 +92,16 @@ def get_engine() -> AsyncEngine:
     return create_async_engine(db_url, **common_kwargs)
 
 
+@lru_cache
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get cached session factory bound to the shared engine.
+
+    expire_on_commit=False keeps loaded attributes readable after commit; async
+    sessions cannot lazy-reload them, so callers refresh explicitly instead.
+    """
+    return async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     engine = get_engine()
@@ -93,8 +111,7 @@ async def init_db() -> None:
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides an async database session."""
-    engine = get_engine()
-    async with AsyncSession(engine) as session:
+    async with get_session_factory()() as session:
         yield session
 
 
@@ -102,7 +119,7 @@ class AsyncSessionMaker:
     """Context manager for creating async sessions outside of FastAPI dependencies."""
 
     async def __aenter__(self) -> AsyncSession:
-        self.session = AsyncSession(get_engine())
+        self.session = get_session_factory()()
         return self.session
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
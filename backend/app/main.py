@@ -44,6 +44,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except (asyncio.TimeoutError, asyncio.CancelledError):
         monitor_task.cancel()
 
+    from app.routers.pipeline import close_arq_pool
+
+    await close_arq_pool()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from sqlmodel import Field, SQLModel, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index, text
 
 from app.taxonomy import ContentClass, EventFamily, EventSubtype, MethodOfDeath
 
@@ -67,6 +67,16 @@ class RawEvent(RawEventBase, table=True):
     """Raw event extracted from a source."""
     
     __tablename__ = "raw_event"
+    # Batch dedup pops pending rows newest-first; once clustered a row drops
+    # out of this index, so it stays the size of the backlog.
+    __table_args__ = (
+        Index(
+            "ix_raw_event_dedup_pending",
+            "event_date",
+            sqlite_where=text("deduplication_status = 'pending'"),
+            postgresql_where=text("deduplication_status = 'pending'"),
+        ),
+    )
     
     id: int | None = Field(default=None, primary_key=True)
     
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlmodel import Field, SQLModel
 
 
@@ -72,6 +72,8 @@ class SourceGoogleNews(SourceGoogleNewsBase, table=True):
     """Google News source record."""
     
     __tablename__ = "source_google_news"
+    # Queue pops filter on one status and take the oldest ids first.
+    __table_args__ = (Index("ix_source_google_news_status_id", "status", "id"),)
     
     id: int | None = Field(default=None, primary_key=True)
     fetched_at: datetime = Field(default_factory=datetime.utcnow)
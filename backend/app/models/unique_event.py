@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from sqlmodel import Field, SQLModel, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index, text
 
 from app.taxonomy import ContentClass, EventFamily, EventSubtype
 
@@ -96,6 +96,15 @@ class UniqueEvent(UniqueEventBase, table=True):
     """Unique/deduplicated event record."""
     
     __tablename__ = "unique_event"
+    # Only events awaiting enrichment are indexed for the batch enrich pop.
+    __table_args__ = (
+        Index(
+            "ix_unique_event_needs_enrichment_partial",
+            "id",
+            sqlite_where=text("needs_enrichment = true"),
+            postgresql_where=text("needs_enrichment = true"),
+        ),
+    )
     
     id: int | None = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, status
 from app.auth import (
     authenticate_user,
     create_access_token,
+    decode_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     LoginRequest,
     Token,
@@ -42,14 +43,5 @@ async def login(request: LoginRequest):
 @router.post("/verify")
 async def verify_token(token: str):
     """Verify if a token is valid."""
-    from app.auth import decode_access_token
-    
-    try:
-        token_data = decode_access_token(token)
-        return {"valid": True, "username": token_data.username}
-    except HTTPException:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-
+    token_data = decode_access_token(token)
+    return {"valid": True, "username": token_data.username}
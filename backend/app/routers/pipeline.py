@@ -1,7 +1,8 @@
 """Pipeline control API router."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from arq.jobs import Job
+from arq.connections import ArqRedis
+from arq.jobs import Job, deserialize_job, job_key_prefix
 from loguru import logger
 
 import json
@@ -23,16 +24,43 @@ router = APIRouter(
 )
 
 
-async def get_arq_pool():
-    """Get ARQ Redis pool."""
-    try:
-        return await create_arq_pool()
-    except Exception as e:
-        logger.error(f"Failed to connect to Redis: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail=f"Redis connection failed: {e}. Is Redis running? Try: docker compose up -d redis",
-        )
+# Most rows /city-stats returns; totals still count every tracked city.
+CITY_STATS_LIMIT = 200
+
+# Queued jobs /status lists; the count covers the whole queue.
+QUEUED_JOBS_PREVIEW = 20
+
+# Shared ARQ pool: enqueueing one job should not pay for a fresh Redis
+# connection. Closed by the app lifespan on shutdown.
+_arq_pool: ArqRedis | None = None
+
+
+async def get_arq_pool() -> ArqRedis:
+    """Get or create the shared ARQ Redis pool."""
+    global _arq_pool
+    if _arq_pool is None:
+        try:
+            pool = await create_arq_pool()
+        except Exception as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            raise HTTPException(
+                status_code=503,
+                detail=f"Redis connection failed: {e}. Is Redis running? Try: docker compose up -d redis",
+            )
+        # Another request may have connected while this one awaited.
+        if _arq_pool is None:
+            _arq_pool = pool
+        else:
+            await pool.close()
+    return _arq_pool
+
+
+async def close_arq_pool() -> None:
+    """Close the shared ARQ pool (app shutdown)."""
+    global _arq_pool
+    if _arq_pool is not None:
+        await _arq_pool.close()
+        _arq_pool = None
 
 
 # =============================================================================
@@ -66,7 +94,6 @@ async def run_full_pipeline_endpoint(
         city_list = [c.strip() for c in cities.split(",") if c.strip()]
     
     job = await pool.enqueue_job("ingest_cities_full_pipeline", city_list, when)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -96,7 +123,6 @@ async def run_pipeline(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("run_full_pipeline", query, when)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -119,7 +145,6 @@ async def run_ingestion(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("ingest_task", query, when)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -144,7 +169,6 @@ async def run_city_ingestion(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("ingest_cities_task", None, when)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -165,7 +189,6 @@ async def run_city_pipeline(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("ingest_cities_full_pipeline", None, when)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -187,7 +210,6 @@ async def run_classify_batch(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("classify_pending_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -202,7 +224,6 @@ async def run_classify_single(source_id: int):
     """Stage 1.5: Classify headline for a single source."""
     pool = await get_arq_pool()
     job = await pool.enqueue_job("classify_task", source_id)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -223,7 +244,6 @@ async def run_download_batch(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("download_classified_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -238,7 +258,6 @@ async def run_download_single(source_id: int):
     """Stage 2: Download content for a single source."""
     pool = await get_arq_pool()
     job = await pool.enqueue_job("download_task", source_id)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -257,7 +276,6 @@ async def run_extract_batch(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("extract_ready_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -272,7 +290,6 @@ async def run_extract_single(source_id: int):
     """Stage 3: Extract event from a single source."""
     pool = await get_arq_pool()
     job = await pool.enqueue_job("extract_task", source_id)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -287,7 +304,6 @@ async def run_enrichment(raw_event_id: int):
     """Stage 4: Enrich a raw event (deduplicate, geocode)."""
     pool = await get_arq_pool()
     job = await pool.enqueue_job("enrich_task", raw_event_id)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -312,7 +328,6 @@ async def run_batch_deduplication(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("batch_dedup_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -336,7 +351,6 @@ async def run_batch_enrichment(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("batch_enrich_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -364,7 +378,6 @@ async def run_batch_geocoding(
     """
     pool = await get_arq_pool()
     job = await pool.enqueue_job("batch_geocode_task", limit)
-    await pool.close()
 
     return {
         "status": "queued",
@@ -395,10 +408,29 @@ async def get_pipeline_status():
 
 async def collect_pipeline_status() -> dict:
     """Collect worker/queue/cron status from Redis."""
-    pool = None
     try:
         pool = await get_arq_pool()
-        queued_jobs = await pool.queued_jobs()
+        # queued_jobs() would fetch and unpickle every job in the queue.
+        queue_name = pool.default_queue_name
+        queued_count = await pool.zcard(queue_name)
+        head_ids = await pool.zrange(queue_name, 0, QUEUED_JOBS_PREVIEW - 1)
+        payloads = (
+            await pool.mget([job_key_prefix + job_id.decode() for job_id in head_ids])
+            if head_ids
+            else []
+        )
+        jobs = []
+        for job_id, raw in zip(head_ids, payloads):
+            if raw is None:  # picked up by a worker between ZRANGE and MGET
+                continue
+            job = deserialize_job(raw, deserializer=pool.job_deserializer)
+            jobs.append(
+                {
+                    "job_id": job_id.decode(),
+                    "function": job.function,
+                    "enqueue_time": job.enqueue_time.isoformat() if job.enqueue_time else None,
+                }
+            )
         raw_health = await pool.get(HEALTH_CHECK_KEY)
         raw_info = await pool.get(WORKER_INFO_KEY)
 
@@ -427,15 +459,8 @@ async def collect_pipeline_status() -> dict:
             "worker_health": worker_health,
             "worker_started_at": worker_started_at,
             "cron_enabled": cron_enabled,
-            "queued_jobs": len(queued_jobs),
-            "jobs": [
-                {
-                    "job_id": job.job_id,
-                    "function": job.function,
-                    "enqueue_time": job.enqueue_time.isoformat() if job.enqueue_time else None,
-                }
-                for job in queued_jobs[:20]
-            ],
+            "queued_jobs": queued_count,
+            "jobs": jobs,
         }
     except HTTPException:
         raise
@@ -449,9 +474,6 @@ async def collect_pipeline_status() -> dict:
             "error": str(e),
             "queued_jobs": 0,
         }
-    finally:
-        if pool is not None:
-            await pool.close()
 
 
 @router.get("/city-stats")
@@ -461,21 +483,32 @@ async def get_city_stats():
     
     Shows which cities have sharding enabled and last result counts.
     """
+    from sqlalchemy import case, func
     from sqlmodel import select
     from app.database import async_session_maker
     from app.models import CityStats
     from app.services.cities import CITIES
     
     async with async_session_maker() as session:
-        result = await session.exec(select(CityStats).order_by(CityStats.last_result_count.desc()))
+        # Totals come from one aggregate; only the busiest cities are hydrated.
+        totals = await session.exec(
+            select(
+                func.count(CityStats.id),
+                func.coalesce(func.sum(case((CityStats.needs_sharding, 1), else_=0)), 0),
+            )
+        )
+        tracked_cities, sharded_cities = totals.one()
+        result = await session.exec(
+            select(CityStats)
+            .order_by(CityStats.last_result_count.desc())
+            .limit(CITY_STATS_LIMIT)
+        )
         all_stats = result.all()
     
-    sharded_cities = [s for s in all_stats if s.needs_sharding]
-    
     return {
         "configured_cities": len(CITIES),
-        "tracked_cities": len(all_stats),
-        "sharded_cities": len(sharded_cities),
+        "tracked_cities": tracked_cities,
+        "sharded_cities": sharded_cities,
         "stats": [
             {
                 "city": s.city_name,
@@ -507,8 +540,6 @@ async def get_job_status(job_id: str):
             except Exception:
                 pass
         
-        await pool.close()
-        
         # Safely extract info fields
         response = {
             "job_id": job_id,
@@ -523,7 +554,6 @@ async def get_job_status(job_id: str):
         
         return response
     except Exception as e:
-        await pool.close()
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -449,6 +449,7 @@ async def classify_pending_sources(limit: int = 50, concurrency: int = 10) -> di
                 SELECT id FROM source_google_news 
                 WHERE status = 'ready_for_classification' 
                 AND headline IS NOT NULL 
+                ORDER BY id
                 LIMIT :limit
             """),
             {"limit": limit}
@@ -144,7 +144,7 @@ def _add_name_keys(keys: set[str], name: str | None) -> None:
             break
     # First comma often separates name from age/role — but only if left side looks like a name.
     if "," in cleaned:
-        head = cleaned.split(",", 1)[0].strip()
+        head = cleaned.partition(",")[0].strip()
         if _looks_like_person_name(_norm(head)):
             cleaned = head
 
@@ -179,7 +179,7 @@ def _victim_name_keys(row: dict) -> set[str]:
     summary = row.get("victims_summary") or ""
     if summary:
         # Prefer a short leading name clause; ignore long narrative dumps.
-        head = summary.split("\n", 1)[0].strip()
+        head = summary.partition("\n")[0].strip()
         _add_name_keys(keys, head)
 
     return keys
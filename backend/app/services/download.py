@@ -90,9 +90,12 @@ async def _fetch_html(url: str) -> tuple[int, str]:
         timeout=settings.download_timeout_seconds,
         headers=headers,
     ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.status_code, response.text
+        async with client.stream("GET", url) as response:
+            # Failures are classified from the status alone, so error pages
+            # (paywalls, 403/404 bodies) are never downloaded.
+            response.raise_for_status()
+            await response.aread()
+            return response.status_code, response.text
 
 
 def _heuristic_failure_reason(match: HeuristicMatch) -> str:
@@ -385,6 +388,7 @@ async def download_classified_sources(limit: int = 50, concurrency: int = 10) ->
                 SELECT id FROM source_google_news 
                 WHERE status = 'ready_for_download' 
                 AND resolved_url IS NOT NULL 
+                ORDER BY id
                 LIMIT :limit
             """),
             {"limit": limit}
@@ -61,11 +61,23 @@ def coerce_json_field(value) -> dict | list | None:
     if isinstance(value, str):
         try:
             return json.loads(value)
-        except json.JSONDecodeError:
+        except ValueError:
             return None
     return None
 
 
+def merged_data_param(current, new: dict | None) -> str | None:
+    """
+    Serialize ``new`` for the ``merged_data = COALESCE(:merged_data, merged_data)`` update.
+
+    Returns None when the stored value already equals ``new``, so reruns that pick
+    the same winning extraction don't rewrite the JSON column.
+    """
+    if new is None or coerce_json_field(current) == new:
+        return None
+    return json.dumps(new)
+
+
 # === Configuration ===
 DATE_TOLERANCE_DAYS = 1  # For date+city blocking
 VICTIM_NAME_DATE_TOLERANCE_DAYS = 10  # Wider window when victim name matches
@@ -1765,7 +1777,7 @@ async def enrich_unique_event(unique_event_id: int) -> bool:
             "victim_count": result.victim_count,
             "chronological_description": result.chronological_description,
             "enrichment_model": settings.enrichment_model,
-            "merged_data": json.dumps(winning_payload) if winning_payload is not None else None,
+            "merged_data": merged_data_param(getattr(unique_row, "merged_data", None), winning_payload),
             "security_force_involved": public_fields["security_force_involved"],
             "security_force_victim": public_fields["security_force_victim"],
             "criminal_group_connected": public_fields["criminal_group_connected"],
@@ -612,6 +612,7 @@ async def extract_ready_sources(limit: int = 10, concurrency: int = 15) -> dict:
                 SELECT id FROM source_google_news 
                 WHERE status = 'ready_for_extraction' 
                 AND content IS NOT NULL 
+                ORDER BY id
                 LIMIT :limit
             """),
             {"limit": limit}
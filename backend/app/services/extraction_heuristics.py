@@ -353,9 +353,7 @@ def normalize_date_string(date: str | None) -> str | None:
     """Coerce ISO datetimes to YYYY-MM-DD for eval and storage consistency."""
     if not date:
         return date
-    if "T" in date:
-        return date.split("T", 1)[0]
-    return date
+    return date.partition("T")[0]
 
 
 def _parse_count_token(token: str) -> int | None:
@@ -31,7 +31,7 @@ def get_client_ip(request: Request) -> str:
     """Resolve client IP, honoring reverse-proxy headers."""
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        return forwarded.partition(",")[0].strip()
     if request.client and request.client.host:
         return request.client.host
     return "unknown"
@@ -358,6 +358,11 @@ async def geocode_user_query(
         return None
     if re.match(r"^(brasil|brazil)$", query, re.I):
         return dict(BRAZIL_COUNTRY_RESULT)
+    if client is None:
+        # One pooled client for the ViaCEP, Google and Nominatim hops below,
+        # so a single lookup does not pay for up to three TLS handshakes.
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            return await geocode_user_query(query, client=client)
     # Accept CEPs with or without a dash (e.g. "22221150" or "22221-150").
     # Resolve them through ViaCEP first since raw CEPs geocode poorly on OSM.
     cep = normalize_cep(query)
@@ -389,9 +394,6 @@ async def geocode_user_query(
         "countrycodes": "br",
         "accept-language": "pt-BR",
     }
-    owns_client = client is None
-    if owns_client:
-        client = httpx.AsyncClient(timeout=15.0)
     try:
         response = await client.get(
             NOMINATIM_URL,
@@ -403,9 +405,6 @@ async def geocode_user_query(
     except (httpx.HTTPError, ValueError) as e:
         logger.error(f"[Geocode] Nominatim request failed for '{query}': {e}")
         return None
-    finally:
-        if owns_client:
-            await client.aclose()
 
     if not results:
         logger.info(f"[Geocode] Nominatim: no results for '{query}'")
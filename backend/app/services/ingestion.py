@@ -1,11 +1,16 @@
 """Ingestion service - fetches Google News RSS and creates SourceGoogleNews records."""
 
 import asyncio
+import threading
 import urllib.parse
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 import feedparser
 import googlenewsdecoder
+import httpx
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
@@ -29,6 +34,46 @@ DEFAULT_PARAMS = {
     "gl": "BR",
     "ceid": "BR:pt-419",
 }
+# The locale params never change, so encode them once and append per query.
+_DEFAULT_QUERY_SUFFIX = urllib.parse.urlencode(DEFAULT_PARAMS, safe=":")
+
+# Every feed request goes to news.google.com, so one pooled client keeps the
+# TCP/TLS connection alive across queries instead of reconnecting per feed.
+RSS_REQUEST_TIMEOUT_SECONDS = 20.0
+_http_client: httpx.Client | None = None
+# Feeds are fetched from worker threads (asyncio.to_thread), so creation and
+# shutdown are serialized to keep concurrent first fetches on one client.
+_http_client_lock = threading.Lock()
+
+# ETag / Last-Modified per feed URL, recorded only once that response's entries
+# are committed. Hourly runs replay them as conditional GETs; an unchanged feed
+# answers 304 with no body to parse.
+_feed_validators: dict[str, dict[str, str]] = {}
+
+
+def get_http_client() -> httpx.Client:
+    """Get or create the shared HTTP client used for RSS fetches."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    headers={"User-Agent": feedparser.USER_AGENT},
+                    timeout=RSS_REQUEST_TIMEOUT_SECONDS,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+                    transport=httpx.HTTPTransport(retries=2),
+                )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared RSS HTTP client (worker shutdown)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
 
 
 async def _resolved_url_exists(session: AsyncSession, resolved_url: str | None) -> bool:
@@ -48,19 +93,15 @@ DEFAULT_QUERIES = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def build_rss_url(query: str, when: str | None = "7d") -> str:
-    """Build Google News RSS URL with proper encoding."""
+    """Build Google News RSS URL with proper encoding (memoized: queries repeat hourly)."""
     full_query = query
     if when:
         full_query = f"{query} when:{when}"
-    
-    params = {
-        "q": full_query,
-        **DEFAULT_PARAMS,
-    }
-    
-    query_string = urllib.parse.urlencode(params, safe=":")
-    return f"{GOOGLE_NEWS_BASE_URL}?{query_string}"
+
+    query_string = urllib.parse.urlencode({"q": full_query}, safe=":")
+    return f"{GOOGLE_NEWS_BASE_URL}?{query_string}&{_DEFAULT_QUERY_SUFFIX}"
 
 
 def parse_headline_and_publisher(title: str) -> tuple[str, str | None]:
@@ -68,12 +109,23 @@ def parse_headline_and_publisher(title: str) -> tuple[str, str | None]:
     Parse RSS title to extract headline and publisher.
     Format: "Headline text - Publisher Name"
     """
-    if " - " in title:
-        parts = title.rsplit(" - ", 1)
-        return parts[0].strip(), parts[1].strip()
+    headline, separator, publisher = title.rpartition(" - ")
+    if separator:
+        return headline.strip(), publisher.strip()
     return title.strip(), None
 
 
+def parse_published_at(entry) -> datetime | None:
+    """Convert the feed's UTC ``published_parsed`` struct_time to a naive datetime."""
+    published = entry.get("published_parsed")
+    if not published:
+        return None
+    try:
+        return datetime(*published[:6])
+    except (TypeError, ValueError):
+        return None
+
+
 def resolve_google_news_url(obfuscated_url: str) -> str | None:
     """Resolve obfuscated Google News URL to the real publisher URL."""
     if "news.google.com" not in obfuscated_url:
@@ -89,6 +141,78 @@ def resolve_google_news_url(obfuscated_url: str) -> str | None:
     return None
 
 
+@dataclass
+class FeedPayload:
+    """One RSS response: the raw body plus a feedparser view built on first use."""
+
+    url: str
+    content: bytes
+    content_type: str | None = None
+    not_modified: bool = False
+    validators: dict[str, str] = field(default_factory=dict)
+
+    @cached_property
+    def feed(self) -> feedparser.FeedParserDict:
+        # Hand feedparser the server's Content-Type so it takes the declared
+        # charset instead of sniffing the body for one. Titles and source names
+        # are stored and served, so they stay sanitized; only the relative-URI
+        # rewrite is skipped, as feed links are already absolute.
+        headers = {"content-type": self.content_type} if self.content_type else None
+        return feedparser.parse(
+            self.content,
+            response_headers=headers,
+            resolve_relative_uris=False,
+        )
+
+    @property
+    def entries(self) -> list[dict]:
+        """Feed entries; empty when the server answered 304 Not Modified."""
+        if self.not_modified:
+            return []
+        if self.feed.bozo:
+            logger.warning(f"Feed parsing error: {self.feed.bozo_exception}")
+        return self.feed.entries
+
+
+def fetch_rss_payload(query: str, when: str | None = "7d") -> FeedPayload | None:
+    """
+    Fetch the RSS body for a query with a single GET; None on HTTP failure.
+
+    Sends the validators recorded for this URL, if any. The response's own
+    validators ride on the payload; callers record them with
+    ``_remember_feed_validators`` after its entries are saved.
+    """
+    url = build_rss_url(query, when)
+    logger.info(f"Fetching RSS feed: {url}")
+
+    try:
+        response = get_http_client().get(url, headers=_feed_validators.get(url))
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return FeedPayload(url=url, content=b"", not_modified=True)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"Feed request failed for query {query!r}: {e}")
+        return None
+
+    return FeedPayload(
+        url=url,
+        content=response.content,
+        content_type=response.headers.get("content-type"),
+        validators={
+            header: response.headers[source]
+            for header, source in (("If-None-Match", "etag"), ("If-Modified-Since", "last-modified"))
+            if source in response.headers
+        },
+    )
+
+
+def _remember_feed_validators(payloads: Iterable[FeedPayload | None]) -> None:
+    """Record validators for fetched feeds whose entries are now persisted."""
+    for payload in payloads:
+        if payload is not None and payload.validators:
+            _feed_validators[payload.url] = payload.validators
+
+
 def fetch_rss_feed(query: str, when: str | None = "7d") -> list[dict]:
     """
     Fetch RSS feed entries for a query.
@@ -100,16 +224,16 @@ def fetch_rss_feed(query: str, when: str | None = "7d") -> list[dict]:
     Returns:
         List of parsed feed entries
     """
-    url = build_rss_url(query, when)
-    logger.info(f"Fetching RSS feed: {url}")
-    
-    feed = feedparser.parse(url)
-    
-    if feed.bozo:
-        logger.warning(f"Feed parsing error: {feed.bozo_exception}")
-    
-    logger.info(f"Found {len(feed.entries)} entries for query: {query}")
-    return feed.entries
+    payload = fetch_rss_payload(query, when)
+    if payload is None:
+        return []
+    if payload.not_modified:
+        logger.info(f"Feed unchanged since last fetch for query: {query}")
+        return []
+
+    entries = payload.entries
+    logger.info(f"Found {len(entries)} entries for query: {query}")
+    return entries
 
 
 async def ingest_feeds(
@@ -130,10 +254,14 @@ async def ingest_feeds(
     """
     queries = queries or DEFAULT_QUERIES
     all_entries = []
+    payloads = []
     
     # Fetch all RSS feeds
     for query in queries:
-        entries = fetch_rss_feed(query, when)
+        payload = fetch_rss_payload(query, when)
+        payloads.append(payload)
+        entries = payload.entries if payload is not None else []
+        logger.info(f"Found {len(entries)} entries for query: {query}")
         for entry in entries:
             entry["_search_query"] = query
         all_entries.extend(entries)
@@ -143,6 +271,8 @@ async def ingest_feeds(
     # Process and save to database
     new_sources = []
     
+    # One timestamp for the whole batch: every entry came from the same fetch.
+    fetched_at = datetime.utcnow()
     async with async_session_maker() as session:
         for entry in all_entries:
             # Extract Google News ID from the link (the guid)
@@ -167,12 +297,7 @@ async def ingest_feeds(
             publisher_url = source_info.get("href") if isinstance(source_info, dict) else None
             
             # Parse publication date
-            published_at = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                try:
-                    published_at = datetime(*entry.published_parsed[:6])
-                except Exception:
-                    pass
+            published_at = parse_published_at(entry)
             
             # Resolve URL if requested
             google_news_url = entry.get("link", "")
@@ -197,7 +322,7 @@ async def ingest_feeds(
                 published_at=published_at,
                 search_query=entry.get("_search_query"),
                 status=SourceStatus.ready_for_classification,
-                fetched_at=datetime.utcnow(),
+                fetched_at=fetched_at,
             )
             
             session.add(source)
@@ -208,6 +333,8 @@ async def ingest_feeds(
             # Refresh to get IDs
             for source in new_sources:
                 await session.refresh(source)
+
+    _remember_feed_validators(payloads)
     
     logger.info(f"Created {len(new_sources)} new sources")
     return new_sources
@@ -278,8 +405,9 @@ async def update_city_stats(
     stats = await get_or_create_city_stats(city, session)
     
     stats.last_result_count = total_count
-    stats.last_fetch_at = datetime.utcnow()
-    stats.updated_at = datetime.utcnow()
+    now = datetime.utcnow()
+    stats.last_fetch_at = now
+    stats.updated_at = now
     
     if total_count >= SHARDING_THRESHOLD and not stats.needs_sharding:
         stats.needs_sharding = True
@@ -324,14 +452,16 @@ def get_rate_limiter() -> AsyncRateLimiter:
     return _rate_limiter
 
 
-async def rate_limited_fetch(query: str, when: str | None = None) -> list[dict]:
+async def rate_limited_fetch(query: str, when: str | None = None) -> FeedPayload | None:
     """
-    Fetch RSS feed with rate limiting.
+    Fetch an RSS payload with rate limiting.
     Uses a shared rate limiter to coordinate parallel requests.
     """
     limiter = get_rate_limiter()
     await limiter.acquire()
-    return fetch_rss_feed(query, when=when)
+    # The HTTP fetch blocks; run it in a thread so other cities' DB work and
+    # fetches keep progressing on the event loop meanwhile.
+    return await asyncio.to_thread(fetch_rss_payload, query, when)
 
 
 async def ingest_city(
@@ -351,11 +481,16 @@ async def ingest_city(
         # Get queries based on sharding status
         queries = await get_queries_for_city(city, session, when)
         
-        # Fetch all queries with rate limiting
-        for query in queries:
-            # Rate limited fetch (when is already in the query string)
-            entries = await rate_limited_fetch(query, when=None)
-            
+        # Fetch each distinct query once. The shard requests are independent,
+        # so issue them together and let the shared rate limiter pace them
+        # (when is already in the query string).
+        queries = list(dict.fromkeys(queries))
+        payloads = await asyncio.gather(
+            *(rate_limited_fetch(query, when=None) for query in queries)
+        )
+
+        for query, payload in zip(queries, payloads):
+            entries = payload.entries if payload is not None else []
             # Tag entries with their query
             for entry in entries:
                 entry["_search_query"] = query
@@ -367,13 +502,20 @@ async def ingest_city(
         total_count = len(all_entries)
         logger.info(f"[{city}] Total entries: {total_count}")
         
-        # Update city stats (this may enable sharding for next run)
-        await update_city_stats(city, total_count, session)
+        if any(payload is not None and payload.not_modified for payload in payloads):
+            # A 304 carries no entries, so total_count undercounts the feed;
+            # keep the last real count behind the sharding decision.
+            logger.info(f"[{city}] Feed unchanged since last fetch; keeping city stats")
+        else:
+            # Update city stats (this may enable sharding for next run)
+            await update_city_stats(city, total_count, session)
     
     # Now save the entries to database (one savepoint per row so parallel city
     # ingests that hit the same google_news_id do not fail the whole batch).
     new_sources = []
 
+    # One timestamp for the whole batch: every entry came from the same fetch.
+    fetched_at = datetime.utcnow()
     async with async_session_maker() as session:
         for entry in all_entries:
             google_news_id = entry.get("id") or entry.get("link", "")
@@ -386,12 +528,7 @@ async def ingest_city(
             source_info = entry.get("source", {})
             publisher_url = source_info.get("href") if isinstance(source_info, dict) else None
 
-            published_at = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                try:
-                    published_at = datetime(*entry.published_parsed[:6])
-                except Exception:
-                    pass
+            published_at = parse_published_at(entry)
 
             google_news_url = entry.get("link", "")
             resolved_url = None
@@ -421,7 +558,7 @@ async def ingest_city(
                         published_at=published_at,
                         search_query=entry.get("_search_query"),
                         status=SourceStatus.ready_for_classification,
-                        fetched_at=datetime.utcnow(),
+                        fetched_at=fetched_at,
                     )
                     session.add(source)
                     await session.flush()
@@ -436,6 +573,8 @@ async def ingest_city(
             await session.commit()
             for source in new_sources:
                 await session.refresh(source)
+
+    _remember_feed_validators(payloads)
     
     logger.info(f"[{city}] Created {len(new_sources)} new sources")
     return new_sources, total_count
@@ -460,7 +599,9 @@ async def ingest_all_cities(
     Returns:
         Summary dict with statistics
     """
-    cities = cities or CITIES
+    # Duplicate cities would fetch the same feed URLs twice in parallel and then
+    # race on the same google_news_ids; keep the first occurrence of each.
+    cities = list(dict.fromkeys(cities or CITIES))
     
     logger.info(f"Starting PARALLEL city ingestion for {len(cities)} cities")
     logger.info(f"Max concurrent: {max_concurrent}")
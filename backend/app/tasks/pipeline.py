@@ -1,8 +1,10 @@
 """Pipeline task definitions for ARQ."""
 
+import asyncio
 import functools
 import time
-from typing import Any, Callable
+from collections.abc import Callable, Iterable
+from typing import Any
 
 from loguru import logger
 
@@ -79,6 +81,24 @@ def notify_on_failure(task_name: str):
     return decorator
 
 
+# Enqueues in flight at once when a task fans out child jobs: enough to hide
+# Redis round-trips without draining the ArqRedis connection pool.
+ENQUEUE_BATCH_SIZE = 10
+
+
+async def _enqueue_each(redis, function: str, ids: Iterable[int]) -> None:
+    """
+    Enqueue one ``function`` job per id, ``ENQUEUE_BATCH_SIZE`` round-trips at a time.
+    
+    arq has no bulk enqueue; each ``enqueue_job`` is its own WATCH/MULTI pipeline.
+    Batches run in id order, so earlier ids are queued ahead of later ones.
+    """
+    ids = list(ids)
+    for start in range(0, len(ids), ENQUEUE_BATCH_SIZE):
+        batch = ids[start:start + ENQUEUE_BATCH_SIZE]
+        await asyncio.gather(*(redis.enqueue_job(function, id_) for id_ in batch))
+
+
 @notify_on_failure("ingest")
 async def ingest_task(ctx: dict, query: str | None = None, when: str = "3d") -> dict:
     """
@@ -105,8 +125,7 @@ async def ingest_task(ctx: dict, query: str | None = None, when: str = "3d") ->
     
     # Enqueue classification tasks for new sources
     if sources and ctx.get("redis"):
-        for source in sources:
-            await ctx["redis"].enqueue_job("classify_task", source.id)
+        await _enqueue_each(ctx["redis"], "classify_task", (s.id for s in sources))
         logger.info(f"[INGEST] Enqueued {len(sources)} classification tasks")
     
     return {
@@ -371,8 +390,7 @@ async def extract_ready_task(
     # Enqueue per-raw-event enrichment (standalone runs only; full pipeline uses batch dedup).
     raw_event_ids = result.get("raw_event_ids", [])
     if chain_next and raw_event_ids and ctx.get("redis"):
-        for raw_event_id in raw_event_ids:
-            await ctx["redis"].enqueue_job("enrich_task", raw_event_id)
+        await _enqueue_each(ctx["redis"], "enrich_task", raw_event_ids)
         logger.info(f"[EXTRACT_BATCH] Enqueued {len(raw_event_ids)} enrichment tasks")
     
     return {
@@ -176,6 +176,9 @@ async def shutdown(ctx: dict) -> None:
     from loguru import logger
     logger.info("ARQ Worker shutting down...")
 
+    from app.services.ingestion import close_http_client
+    close_http_client()
+
     metrics_task = ctx.get("metrics_task")
     if metrics_task is not None and not metrics_task.done():
         metrics_task.cancel()
@@ -1,13 +1,23 @@
 """Pytest fixtures for testing."""
 
+import asyncio
+import itertools
+import os
+
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlmodel import SQLModel
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.main import create_app
-from app.database import get_session
+# Settings.debug turns on SQL echo for the app engine; keep a developer's .env
+# DEBUG=true from logging every statement. An explicit DEBUG in the shell wins.
+os.environ.setdefault("DEBUG", "false")
+
+from app.database import get_session  # noqa: E402
+from app.main import create_app  # noqa: E402
 
 
 @pytest.fixture
@@ -16,14 +26,76 @@ def anyio_backend():
     return "asyncio"
 
 
+ARTICLE_HTML = (
+    "<html><head><title>Homem é morto a tiros no Centro</title>"
+    '<meta name="description" content="Vítima foi atingida por disparos na madrugada.">'
+    "</head><body><article><h1>Homem é morto a tiros no Centro</h1>"
+    "<p>Um homem de 32 anos foi morto a tiros na madrugada deste domingo no Centro "
+    "do Rio de Janeiro. Segundo a Polícia Militar, a vítima foi atingida por vários "
+    "disparos quando saía de um bar.</p>"
+    "<p>A Delegacia de Homicídios da Capital investiga o caso. Ninguém foi preso "
+    "até o momento.</p></article>"
+    "<footer>Todos os direitos reservados</footer></body></html>"
+)
+
+
+@pytest.fixture(scope="session")
+def article_html():
+    """Small news article page shared by HTML extraction tests."""
+    return ARTICLE_HTML
+
+
+@pytest.fixture(scope="session")
+def extracted_article(article_html):
+    """trafilatura output for ``article_html``, parsed once per session."""
+    from app.services.download import extract_content_and_metadata
+
+    return extract_content_and_metadata(article_html)
+
+
+@pytest.fixture(scope="session")
+def extraction_service():
+    """Import the extraction service (instructor, trafilatura) only when a test needs it."""
+    from app.services import extraction
+
+    return extraction
+
+
+async def _run_inline(func, /, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
 @pytest.fixture
+def inline_to_thread(monkeypatch):
+    """Run asyncio.to_thread work on the loop thread.
+
+    Services push LLM and trafilatura calls to a worker thread; in tests those
+    calls are mocks, so the thread hop is pure overhead.
+    """
+    monkeypatch.setattr(asyncio, "to_thread", _run_inline)
+
+
+@pytest.fixture(scope="session")
 async def async_engine():
-    """Create an in-memory async engine for testing."""
+    """In-memory engine with the schema created once for the whole test session."""
+    # StaticPool keeps a single connection, so every session sees the same in-memory DB.
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
     yield engine
@@ -32,22 +104,113 @@ async def async_engine():
 
 @pytest.fixture
 async def async_session(async_engine):
-    """Create an async session for testing."""
-    async with AsyncSession(async_engine) as session:
-        yield session
+    """Session joined to an outer transaction that is rolled back after each test.
+
+    ``commit()`` in tests and services only releases a SAVEPOINT, so every test
+    starts from the same empty schema without recreating it.
+    """
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with AsyncSession(
+            bind=conn, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await transaction.rollback()
+
+
+@pytest.fixture
+def make_source(async_session):
+    """Factory that adds a SourceGoogleNews row to the test session and flushes it."""
+    from app.models.source_google_news import SourceGoogleNews
+
+    counter = itertools.count(1)
+
+    async def _make(**fields) -> SourceGoogleNews:
+        defaults = {
+            "google_news_id": f"test-source-{next(counter)}",
+            "google_news_url": "https://news.example/article",
+            "headline": "Test headline",
+        }
+        defaults.update(fields)
+        source = SourceGoogleNews(**defaults)
+        async_session.add(source)
+        await async_session.flush()
+        return source
+
+    return _make
 
 
 @pytest.fixture
-async def app(async_session):
-    """Create test application with overridden dependencies."""
-    app = create_app()
-    
+def make_raw_event(async_session):
+    """Factory that links a RawEvent to ``unique_event`` and flushes it.
+
+    Title, date and location default to the unique event's, so the row looks
+    like a source that was matched to it.
+    """
+    from app.models.raw_event import RawEvent
+
+    async def _make(unique_event, **fields) -> RawEvent:
+        defaults = {
+            "title": unique_event.title,
+            "event_date": unique_event.event_date,
+            "city": unique_event.city,
+            "state": unique_event.state,
+            "source_google_news_id": 1,
+            "deduplication_status": "matched",
+        }
+        defaults.update(fields)
+        raw_event = RawEvent(unique_event_id=unique_event.id, **defaults)
+        async_session.add(raw_event)
+        await async_session.flush()
+        return raw_event
+
+    return _make
+
+
+async def _allow_export(client_ip: str) -> None:
+    return None
+
+
+@pytest.fixture
+def no_export_rate_limit(monkeypatch):
+    """Let export requests through without touching Redis."""
+    from app.services import geocode_protection
+
+    monkeypatch.setattr(geocode_protection, "enforce_export_rate_limit", _allow_export)
+
+
+@pytest.fixture
+def query_counter(async_engine):
+    """Count statements executed on the test engine; call it to read the total."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    yield lambda: len(statements)
+    event.remove(sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="session")
+def _session_app():
+    """Build the FastAPI app (middleware, routers) once per test session."""
+    # Auth and rate-limit settings are read per request, so one app instance
+    # serves every test in the session.
+    return create_app()
+
+
+@pytest.fixture
+async def app(_session_app, async_session):
+    """Shared test application with get_session routed to this test's session."""
+
     async def override_get_session():
         yield async_session
-    
-    app.dependency_overrides[get_session] = override_get_session
-    yield app
-    app.dependency_overrides.clear()
+
+    _session_app.dependency_overrides[get_session] = override_get_session
+    yield _session_app
+    _session_app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -1,13 +1,16 @@
 """Tests for auth configuration validation and bcrypt login."""
 
 import pytest
+from fastapi import HTTPException
 
 import app.auth as auth_module
 from app.auth import (
     authenticate_user,
+    create_access_token,
     get_password_hash,
     validate_auth_config,
 )
+from app.routers.auth import verify_token
 
 
 @pytest.fixture(autouse=True)
@@ -17,42 +20,36 @@ def reset_auth_module_state():
     auth_module._jwt_secret_key = None
 
 
-@pytest.fixture
-def production_auth_env(monkeypatch):
-    monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setenv("ENABLE_AUTH", "true")
-    monkeypatch.setenv("JWT_SECRET_KEY", "super-secure-production-secret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    monkeypatch.setenv("ADMIN_PASSWORD", get_password_hash("secure-pass"))
-
-
-def test_validate_auth_config_rejects_disabled_auth_in_production(monkeypatch):
-    monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setenv("ENABLE_AUTH", "false")
-    monkeypatch.setenv("JWT_SECRET_KEY", "super-secure-production-secret")
-    monkeypatch.setenv("ADMIN_PASSWORD", get_password_hash("secure-pass"))
-
-    with pytest.raises(RuntimeError, match="ENABLE_AUTH must be true"):
-        validate_auth_config()
-
-
-def test_validate_auth_config_requires_jwt_secret_in_production(monkeypatch):
-    monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setenv("ENABLE_AUTH", "true")
-    monkeypatch.setenv("JWT_SECRET_KEY", "change-me-in-production")
-    monkeypatch.setenv("ADMIN_PASSWORD", get_password_hash("secure-pass"))
-
-    with pytest.raises(RuntimeError, match="JWT_SECRET_KEY must be set"):
-        validate_auth_config()
-
+# bcrypt hashing is deliberately slow; hash the admin password once per module.
+_PRODUCTION_ENV = {
+    "ENVIRONMENT": "production",
+    "ENABLE_AUTH": "true",
+    "JWT_SECRET_KEY": "super-secure-production-secret",
+    "ADMIN_USERNAME": "admin",
+    "ADMIN_PASSWORD": get_password_hash("secure-pass"),
+}
 
-def test_validate_auth_config_requires_bcrypt_hashes_in_production(monkeypatch):
-    monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setenv("ENABLE_AUTH", "true")
-    monkeypatch.setenv("JWT_SECRET_KEY", "super-secure-production-secret")
-    monkeypatch.setenv("ADMIN_PASSWORD", "plaintext-password")
 
-    with pytest.raises(RuntimeError, match="bcrypt hash"):
+@pytest.fixture
+def production_auth_env(request, monkeypatch):
+    """Secure production env; indirect params override individual variables."""
+    overrides = getattr(request, "param", {})
+    for key, value in {**_PRODUCTION_ENV, **overrides}.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.mark.parametrize(
+    ("production_auth_env", "message"),
+    [
+        ({"ENABLE_AUTH": "false"}, "ENABLE_AUTH must be true"),
+        ({"JWT_SECRET_KEY": "change-me-in-production"}, "JWT_SECRET_KEY must be set"),
+        ({"ADMIN_PASSWORD": "plaintext-password"}, "bcrypt hash"),
+    ],
+    indirect=["production_auth_env"],
+    ids=["auth-disabled", "default-jwt-secret", "plaintext-password"],
+)
+def test_validate_auth_config_rejects_insecure_production(production_auth_env, message):
+    with pytest.raises(RuntimeError, match=message):
         validate_auth_config()
 
 
@@ -71,3 +68,30 @@ def test_authenticate_user_allows_plaintext_in_development(monkeypatch):
     monkeypatch.setenv("ADMIN_PASSWORD", "plain-dev-pass")
 
     assert authenticate_user("devadmin", "plain-dev-pass") is True
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("$2a$12$abcdefghijklmnopqrstuv", True),
+        ("$2b$12$abcdefghijklmnopqrstuv", True),
+        ("$2y$12$abcdefghijklmnopqrstuv", True),
+        ("$2x$12$abcdefghijklmnopqrstuv", False),
+        ("plain-dev-pass", False),
+    ],
+)
+def test_is_bcrypt_hash_matches_known_prefixes(value, expected):
+    assert auth_module._is_bcrypt_hash(value) is expected
+
+
+@pytest.mark.asyncio
+async def test_verify_token_returns_username_and_propagates_401(production_auth_env):
+    token = create_access_token({"sub": "admin"})
+
+    assert await verify_token(token) == {"valid": True, "username": "admin"}
+
+    with pytest.raises(HTTPException) as excinfo:
+        await verify_token(token + "tampered")
+
+    assert excinfo.value.status_code == 401
+    assert excinfo.value.headers == {"WWW-Authenticate": "Bearer"}
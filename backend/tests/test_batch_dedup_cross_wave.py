@@ -4,7 +4,6 @@ from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy import text
 
 from app.models.raw_event import RawEvent
 from app.models.unique_event import UniqueEvent
@@ -44,10 +43,6 @@ async def test_batch_dedup_links_pending_raw_to_existing_unique_event(async_sess
         source_count=2,
         chronological_description="Mulher encontrada nua no canteiro central.",
     )
-    async_session.add(existing)
-    await async_session.commit()
-    await async_session.refresh(existing)
-    existing_id = existing.id
 
     pending = RawEvent(
         title="FEMINICÍDIO - RODOVIA SC-281, SERTÃO DO MARUIM - 06/07/2026",
@@ -63,9 +58,11 @@ async def test_batch_dedup_links_pending_raw_to_existing_unique_event(async_sess
             "Motorista de aplicativo encontrou mulher nua no canteiro da SC-281."
         ),
     )
-    async_session.add(pending)
-    await async_session.commit()
+    async_session.add_all([existing, pending])
+    await async_session.flush()
+    await async_session.refresh(existing)
     await async_session.refresh(pending)
+    existing_id = existing.id
     pending_id = pending.id
 
     def fake_llm_match(raw_event, candidates, **kwargs):
@@ -99,7 +96,7 @@ async def test_batch_dedup_links_pending_raw_to_existing_unique_event(async_sess
 
 
 @pytest.mark.asyncio
-async def test_batch_dedup_still_clusters_when_no_existing_match(async_session):
+async def test_batch_dedup_still_clusters_when_no_existing_match(async_session, query_counter):
     """Pending raws with no existing UniqueEvent still cluster into one new event."""
     pending_a = RawEvent(
         title="HOMICÍDIO - BAIRRO CENTRO - 01/01/2026",
@@ -118,7 +115,7 @@ async def test_batch_dedup_still_clusters_when_no_existing_match(async_session):
         deduplication_status="pending",
     )
     async_session.add_all([pending_a, pending_b])
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(pending_a)
     await async_session.refresh(pending_b)
 
@@ -142,8 +139,11 @@ async def test_batch_dedup_still_clusters_when_no_existing_match(async_session):
             create_mock,
         ),
     ):
+        before = query_counter()
         result = await process_pending_deduplication(limit=10)
+        dedup_queries = query_counter() - before
 
+    assert dedup_queries <= 10
     assert result["matched_to_existing"] == 0
     assert result["unique_events_created"] == 1
     create_mock.assert_awaited_once()
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -20,7 +21,6 @@ from app.services.batch_jobs import (
     reextract_sources,
     update_raw_event_in_place,
 )
-from app.services.extraction import raw_event_fields_from_event
 from app.services.extraction_schemas import (
     DateTime,
     DateVerification,
@@ -30,6 +30,8 @@ from app.services.extraction_schemas import (
     ViolentDeathEvent,
 )
 
+pytestmark = pytest.mark.usefixtures("inline_to_thread")
+
 
 def _minimal_event(
     *,
@@ -65,6 +67,21 @@ def _minimal_event(
     )
 
 
+def _fake_result(**returns) -> SimpleNamespace:
+    """Stand-in for a SQLAlchemy Result; each kwarg becomes a zero-arg method."""
+    return SimpleNamespace(**{name: (lambda value=value: value) for name, value in returns.items()})
+
+
+@pytest.fixture
+def session():
+    """AsyncSession stand-in; async_session_maker() hands it back as-is."""
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.add = MagicMock()
+    return session
+
+
 def test_parse_ids_empty():
     assert _parse_ids(None) == []
     assert _parse_ids([]) == []
@@ -121,8 +138,8 @@ def test_dedup_keys_changed_detects_city_and_date():
     )
 
 
-def test_raw_event_fields_from_event_maps_core_columns():
-    fields = raw_event_fields_from_event(_minimal_event())
+def test_raw_event_fields_from_event_maps_core_columns(extraction_service):
+    fields = extraction_service.raw_event_fields_from_event(_minimal_event())
     assert fields["city"] == "São Paulo"
     assert fields["state"] == "SP"
     assert fields["content_class"] == "incident"
@@ -132,7 +149,7 @@ def test_raw_event_fields_from_event_maps_core_columns():
 
 
 @pytest.mark.asyncio
-async def test_reextract_dry_run_does_not_call_llm():
+async def test_reextract_dry_run_does_not_call_llm(mocker):
     candidates = [
         {
             "source_id": 1,
@@ -143,21 +160,20 @@ async def test_reextract_dry_run_does_not_call_llm():
             "headline": "Test",
         }
     ]
-    with patch(
+    mocker.patch(
         "app.services.batch_jobs.find_reextract_candidates",
         new=AsyncMock(return_value=candidates),
-    ), patch(
-        "app.services.extraction.extract_event_from_content",
-    ) as extract_mock:
-        audit = await reextract_sources(dry_run=True, limit=5)
-        extract_mock.assert_not_called()
+    )
+    extract_mock = mocker.patch("app.services.extraction.extract_event_from_content")
+    audit = await reextract_sources(dry_run=True, limit=5)
+    extract_mock.assert_not_called()
     assert audit["candidate_count"] == 1
     assert audit["updated"] == 0
     assert audit["samples"][0]["source_id"] == 1
 
 
 @pytest.mark.asyncio
-async def test_reextract_execute_updates_in_place_and_flags_enrichment():
+async def test_reextract_execute_updates_in_place_and_flags_enrichment(session, mocker):
     candidates = [
         {
             "source_id": 1,
@@ -172,30 +188,26 @@ async def test_reextract_execute_updates_in_place_and_flags_enrichment():
     event = _minimal_event(title="Updated title", event_date="2026-01-02")
     source_row = ("body " * 50, "headline", datetime(2026, 1, 3), "Publisher", "http://x")
 
-    session = AsyncMock()
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    execute_result = MagicMock()
-    execute_result.fetchone.return_value = source_row
-    session.execute = AsyncMock(return_value=execute_result)
+    session.execute.return_value = _fake_result(fetchone=source_row)
 
-    with patch(
+    mocker.patch(
         "app.services.batch_jobs.find_reextract_candidates",
         new=AsyncMock(return_value=candidates),
-    ), patch(
-        "app.services.batch_jobs.async_session_maker",
-        return_value=session,
-    ), patch(
+    )
+    mocker.patch("app.services.batch_jobs.async_session_maker", return_value=session)
+    mocker.patch(
         "app.services.extraction.extract_event_from_content",
         return_value=event,
-    ), patch(
+    )
+    update_mock = mocker.patch(
         "app.services.batch_jobs.update_raw_event_in_place",
         new=AsyncMock(),
-    ) as update_mock, patch(
+    )
+    flag_mock = mocker.patch(
         "app.services.batch_jobs.flag_unique_needs_enrichment",
         new=AsyncMock(return_value=1),
-    ) as flag_mock:
-        audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
+    )
+    audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
 
     assert audit["updated"] == 1
     assert audit["failed"] == 0
@@ -208,7 +220,7 @@ async def test_reextract_execute_updates_in_place_and_flags_enrichment():
 
 
 @pytest.mark.asyncio
-async def test_reextract_unlinks_when_city_changes():
+async def test_reextract_unlinks_when_city_changes(session, mocker):
     candidates = [
         {
             "source_id": 1,
@@ -222,33 +234,30 @@ async def test_reextract_unlinks_when_city_changes():
     ]
     event = _minimal_event(title="Updated title", event_date="2026-01-02")
     source_row = ("body " * 50, "headline", datetime(2026, 1, 3), "Publisher", "http://x")
-    session = AsyncMock()
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    execute_result = MagicMock()
-    execute_result.fetchone.return_value = source_row
-    session.execute = AsyncMock(return_value=execute_result)
+    session.execute.return_value = _fake_result(fetchone=source_row)
 
-    with patch(
+    mocker.patch(
         "app.services.batch_jobs.find_reextract_candidates",
         new=AsyncMock(return_value=candidates),
-    ), patch(
-        "app.services.batch_jobs.async_session_maker",
-        return_value=session,
-    ), patch(
+    )
+    mocker.patch("app.services.batch_jobs.async_session_maker", return_value=session)
+    mocker.patch(
         "app.services.extraction.extract_event_from_content",
         return_value=event,
-    ), patch(
+    )
+    update_mock = mocker.patch(
         "app.services.batch_jobs.update_raw_event_in_place",
         new=AsyncMock(),
-    ) as update_mock, patch(
+    )
+    refresh_mock = mocker.patch(
         "app.services.batch_jobs.refresh_unique_source_counts",
         new=AsyncMock(return_value=1),
-    ) as refresh_mock, patch(
+    )
+    flag_mock = mocker.patch(
         "app.services.batch_jobs.flag_unique_needs_enrichment",
         new=AsyncMock(return_value=0),
-    ) as flag_mock:
-        audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
+    )
+    audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
 
     assert audit["updated"] == 1
     assert audit["unlinked_for_rededup"] == 1
@@ -260,7 +269,7 @@ async def test_reextract_unlinks_when_city_changes():
 
 
 @pytest.mark.asyncio
-async def test_reextract_would_discard_keeps_history():
+async def test_reextract_would_discard_keeps_history(session, mocker):
     candidates = [
         {
             "source_id": 1,
@@ -273,27 +282,22 @@ async def test_reextract_would_discard_keeps_history():
     ]
     event = _minimal_event(content_class="aggregate_statistics", title="Stats")
     source_row = ("body " * 50, "headline", None, "Publisher", "http://x")
-    session = AsyncMock()
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    execute_result = MagicMock()
-    execute_result.fetchone.return_value = source_row
-    session.execute = AsyncMock(return_value=execute_result)
+    session.execute.return_value = _fake_result(fetchone=source_row)
 
-    with patch(
+    mocker.patch(
         "app.services.batch_jobs.find_reextract_candidates",
         new=AsyncMock(return_value=candidates),
-    ), patch(
-        "app.services.batch_jobs.async_session_maker",
-        return_value=session,
-    ), patch(
+    )
+    mocker.patch("app.services.batch_jobs.async_session_maker", return_value=session)
+    mocker.patch(
         "app.services.extraction.extract_event_from_content",
         return_value=event,
-    ), patch(
+    )
+    update_mock = mocker.patch(
         "app.services.batch_jobs.update_raw_event_in_place",
         new=AsyncMock(),
-    ) as update_mock:
-        audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
+    )
+    audit = await reextract_sources(dry_run=False, limit=5, concurrency=1)
 
     assert audit["would_discard"] == 1
     assert audit["updated"] == 0
@@ -301,19 +305,12 @@ async def test_reextract_would_discard_keeps_history():
 
 
 @pytest.mark.asyncio
-async def test_enqueue_drain_uses_namespaced_pool():
-    redis = AsyncMock()
-    redis.enqueue_job = AsyncMock()
-    redis.close = AsyncMock()
-
-    with patch(
-        "app.tasks.worker.create_arq_pool",
-        new=AsyncMock(return_value=redis),
-    ), patch(
-        "app.tasks.worker.get_arq_queue_name",
-        return_value="arquivo:test",
-    ):
-        result = await enqueue_drain(stages=["enrich", "geocode"])
+async def test_enqueue_drain_uses_namespaced_pool(mocker):
+    redis = SimpleNamespace(enqueue_job=AsyncMock(), close=AsyncMock())
+
+    mocker.patch("app.tasks.worker.create_arq_pool", new=AsyncMock(return_value=redis))
+    mocker.patch("app.tasks.worker.get_arq_queue_name", return_value="arquivo:test")
+    result = await enqueue_drain(stages=["enrich", "geocode"])
 
     assert result["queue"] == "arquivo:test"
     assert result["enqueued"] == ["enrich:50", "geocode:200"]
@@ -348,24 +345,17 @@ async def test_clear_geocode_noop_on_empty():
 
 
 @pytest.mark.asyncio
-async def test_update_raw_event_in_place_sets_fields():
-    raw = MagicMock()
-    raw.id = 10
-    result = MagicMock()
-    result.scalar_one_or_none.return_value = raw
+async def test_update_raw_event_in_place_sets_fields(session, mocker):
+    raw = SimpleNamespace(id=10)
+    result = _fake_result(scalar_one_or_none=raw)
 
-    session = AsyncMock()
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    session.execute = AsyncMock(return_value=result)
-    session.add = MagicMock()
-    session.commit = AsyncMock()
+    session.execute.return_value = result
 
-    with patch("app.services.batch_jobs.async_session_maker", return_value=session):
-        await update_raw_event_in_place(
-            10,
-            {"title": "New", "city": "Campinas", "extraction_data": {"a": 1}},
-        )
+    mocker.patch("app.services.batch_jobs.async_session_maker", return_value=session)
+    await update_raw_event_in_place(
+        10,
+        {"title": "New", "city": "Campinas", "extraction_data": {"a": 1}},
+    )
 
     assert raw.title == "New"
     assert raw.city == "Campinas"
@@ -1,14 +1,18 @@
 """Tests for headline classification filters (AQV-31)."""
 
-from unittest.mock import patch
+from functools import partial
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.models.source_google_news import SourceStatus
 from app.services.classification import (
     ViolentDeathClassification,
     classify_source,
 )
 
+pytestmark = pytest.mark.usefixtures("inline_to_thread")
+
 
 class _TestSessionMaker:
     """Route classification DB calls through the pytest async_session."""
@@ -33,17 +37,14 @@ def classification_db(async_session):
         yield async_session
 
 
-def _source(**kwargs):
-    from app.models.source_google_news import SourceGoogleNews, SourceStatus
+_SOURCE_DEFAULTS = {
+    "status": SourceStatus.classifying,
+}
 
-    defaults = {
-        "google_news_id": "test-id",
-        "google_news_url": "https://news.example/article",
-        "headline": "Test headline",
-        "status": SourceStatus.classifying,
-    }
-    defaults.update(kwargs)
-    return SourceGoogleNews(**defaults)
+
+@pytest.fixture
+def add_source(make_source):
+    return partial(make_source, **_SOURCE_DEFAULTS)
 
 
 def _classification(**kwargs) -> ViolentDeathClassification:
@@ -69,107 +70,86 @@ def test_schema_requires_single_incident_field():
     assert result.content_class_hint == "aggregate_statistics"
 
 
-@pytest.mark.asyncio
-async def test_classify_source_passes_single_incident(classification_db):
-    from app.models.source_google_news import SourceStatus
-
-    source = _source(
-        google_news_id="pass-1",
-        headline="Homem é morto a tiros em operação policial no Rio",
-    )
-    classification_db.add(source)
-    await classification_db.commit()
-    await classification_db.refresh(source)
-
-    with patch(
-        "app.services.classification.classify_headline",
-        return_value=_classification(),
-    ):
-        result = await classify_source(source.id)
-
-    assert result is True
-    await classification_db.refresh(source)
-    assert source.status == SourceStatus.ready_for_download
+class TestClassifySource:
+    """classify_source routing with the LLM call stubbed once per class."""
 
+    @pytest.fixture(scope="class")
+    def _classify_headline_patch(self):
+        with patch(
+            "app.services.classification.classify_headline", new_callable=MagicMock
+        ) as mock:
+            yield mock
 
-@pytest.mark.asyncio
-async def test_classify_source_discards_aggregate_headline(classification_db):
-    from app.models.source_google_news import SourceStatus
+    @pytest.fixture
+    def classify_headline_mock(self, _classify_headline_patch):
+        _classify_headline_patch.reset_mock(return_value=True, side_effect=True)
+        return _classify_headline_patch
 
-    source = _source(
-        google_news_id="aggregate-1",
-        headline="CVLI: estado registra 4.241 mortes violentas em 2025",
-    )
-    classification_db.add(source)
-    await classification_db.commit()
-    await classification_db.refresh(source)
-
-    with patch(
-        "app.services.classification.classify_headline",
-        return_value=_classification(
-            is_single_incident=False,
-            content_class_hint="aggregate_statistics",
-            reasoning="Year-end statistics, not a single incident",
-        ),
+    async def test_passes_single_incident(
+        self, classification_db, add_source, classify_headline_mock
     ):
-        result = await classify_source(source.id)
-
-    assert result is False
-    await classification_db.refresh(source)
-    assert source.status == SourceStatus.discarded
-    assert "single_incident=false" in source.classification_reasoning
+        source = await add_source(
+            google_news_id="pass-1",
+            headline="Homem é morto a tiros em operação policial no Rio",
+        )
 
-
-@pytest.mark.asyncio
-async def test_classify_source_discards_foreign_disaster(classification_db):
-    from app.models.source_google_news import SourceStatus
-
-    source = _source(
-        google_news_id="foreign-1",
-        headline="Terremoto na Venezuela deixa centenas de mortos",
-    )
-    classification_db.add(source)
-    await classification_db.commit()
-    await classification_db.refresh(source)
-
-    with patch(
-        "app.services.classification.classify_headline",
-        return_value=_classification(
-            is_violent_death=True,
-            is_single_incident=False,
-            content_class_hint="foreign",
-            reasoning="Foreign disaster report",
-        ),
-    ):
+        classify_headline_mock.return_value = _classification()
         result = await classify_source(source.id)
 
-    assert result is False
-    await classification_db.refresh(source)
-    assert source.status == SourceStatus.discarded
-
-
-@pytest.mark.asyncio
-async def test_classify_source_discards_non_violent_death(classification_db):
-    from app.models.source_google_news import SourceStatus
-
-    source = _source(
-        google_news_id="non-violent-1",
-        headline="Polícia prende suspeito de roubo",
+        assert result is True
+        await classification_db.refresh(source, ["status"])
+        assert source.status == SourceStatus.ready_for_download
+
+    @pytest.mark.parametrize(
+        ("headline", "classification", "reasoning_fragment"),
+        [
+            (
+                "CVLI: estado registra 4.241 mortes violentas em 2025",
+                {
+                    "is_single_incident": False,
+                    "content_class_hint": "aggregate_statistics",
+                    "reasoning": "Year-end statistics, not a single incident",
+                },
+                "single_incident=false",
+            ),
+            (
+                "Terremoto na Venezuela deixa centenas de mortos",
+                {
+                    "is_violent_death": True,
+                    "is_single_incident": False,
+                    "content_class_hint": "foreign",
+                    "reasoning": "Foreign disaster report",
+                },
+                None,
+            ),
+            (
+                "Polícia prende suspeito de roubo",
+                {
+                    "is_violent_death": False,
+                    "is_single_incident": False,
+                    "reasoning": "No death mentioned",
+                },
+                None,
+            ),
+        ],
+        ids=["aggregate-headline", "foreign-disaster", "non-violent-death"],
     )
-    classification_db.add(source)
-    await classification_db.commit()
-    await classification_db.refresh(source)
-
-    with patch(
-        "app.services.classification.classify_headline",
-        return_value=_classification(
-            is_violent_death=False,
-            is_single_incident=False,
-            reasoning="No death mentioned",
-        ),
+    async def test_discards(
+        self,
+        classification_db,
+        add_source,
+        classify_headline_mock,
+        headline,
+        classification,
+        reasoning_fragment,
     ):
+        source = await add_source(headline=headline)
+
+        classify_headline_mock.return_value = _classification(**classification)
         result = await classify_source(source.id)
 
-    assert result is False
-    await classification_db.refresh(source)
-    assert source.status == SourceStatus.discarded
+        assert result is False
+        await classification_db.refresh(source, ["status", "classification_reasoning"])
+        assert source.status == SourceStatus.discarded
+        if reasoning_fragment:
+            assert reasoning_fragment in source.classification_reasoning
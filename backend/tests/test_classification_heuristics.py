@@ -1,5 +1,7 @@
 """Unit tests for classification post-LLM heuristics."""
 
+import pytest
+
 from app.services.classification import ViolentDeathClassification
 from app.services.classification_heuristics import (
     apply_classification_heuristics,
@@ -65,3 +67,18 @@ def test_morre_no_hospital_is_violent_death_not_survival():
     headline = "Homem baleado em Santo André não resiste e morre no hospital"
     assert not should_force_non_violent_death(headline)
     assert should_force_violent_death(headline)
+
+
+@pytest.mark.parametrize(
+    ("headline", "expected"),
+    [
+        ("Jovem é crivado de balas na saída de casa", True),
+        ("Polícia encontra ossada humana em terreno baldio", True),
+        ("Chacina deixa quatro mortos em bar da periferia", True),
+        ("Vítima de FEMINICÍDIO é enterrada em Cuiabá", True),
+        ("Prefeitura anuncia nova ciclovia no centro", False),
+        ("Suspeito troca tiros com a PM e foge", False),
+    ],
+)
+def test_should_force_violent_death(headline, expected):
+    assert should_force_violent_death(headline) is expected
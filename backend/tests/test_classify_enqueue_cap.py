@@ -1,10 +1,13 @@
 """Tests for classify enqueue limits after ingest."""
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.tasks.pipeline import ingest_cities_task
+import app.tasks.pipeline as pipeline_tasks
+from app.tasks.pipeline import ingest_cities_task, ingest_task
 
 
 @pytest.mark.asyncio
@@ -43,3 +46,55 @@ async def test_ingest_enqueues_classify_with_small_batch_limit():
         await ingest_cities_task(ctx, when="1h", enqueue_classify=True)
 
     ctx["redis"].enqueue_job.assert_awaited_once_with("classify_pending_task", 100)
+
+
+@pytest.mark.asyncio
+async def test_ingest_enqueues_classify_jobs_concurrently():
+    sources = [SimpleNamespace(id=source_id) for source_id in (1, 2, 3)]
+    in_flight = asyncio.Barrier(len(sources))
+
+    async def enqueue_job(name, source_id):
+        # Deadlocks unless every enqueue is issued before the first completes.
+        await asyncio.wait_for(in_flight.wait(), timeout=1)
+
+    ctx = {"redis": SimpleNamespace(enqueue_job=AsyncMock(side_effect=enqueue_job))}
+
+    with (
+        patch("app.tasks.pipeline.notify_job_started", new_callable=AsyncMock),
+        patch("app.tasks.pipeline.notify_job_finished", new_callable=AsyncMock),
+        patch(
+            "app.services.ingestion.ingest_feeds",
+            new_callable=AsyncMock,
+            return_value=sources,
+        ),
+    ):
+        result = await ingest_task(ctx, when="1h")
+
+    assert result["source_ids"] == [1, 2, 3]
+    assert [c.args for c in ctx["redis"].enqueue_job.await_args_list] == [
+        ("classify_task", 1),
+        ("classify_task", 2),
+        ("classify_task", 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_each_bounds_in_flight_jobs_and_keeps_id_order(monkeypatch):
+    monkeypatch.setattr(pipeline_tasks, "ENQUEUE_BATCH_SIZE", 4)
+    started: list[int] = []
+    in_flight = peak = 0
+
+    async def enqueue_job(name, source_id):
+        nonlocal in_flight, peak
+        started.append(source_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    redis = SimpleNamespace(enqueue_job=AsyncMock(side_effect=enqueue_job))
+
+    await pipeline_tasks._enqueue_each(redis, "classify_task", range(10))
+
+    assert started == list(range(10))
+    assert peak == 4
@@ -0,0 +1,52 @@
+"""Tests for database engine configuration helpers."""
+
+import sqlite3
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import _normalize_database_url, _set_sqlite_pragmas, get_session_factory
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    connection = sqlite3.connect(tmp_path / "pipeline.db")
+    try:
+        _set_sqlite_pragmas(connection, None)
+
+        def pragma(name):
+            return connection.execute(f"PRAGMA {name}").fetchone()[0]
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("foreign_keys") == 1
+        assert pragma("cache_size") == -64000
+        assert pragma("mmap_size") == 268435456
+    finally:
+        connection.close()
+
+
+@pytest.mark.asyncio
+async def test_session_factory_is_shared_and_disables_expire_on_commit():
+    factory = get_session_factory()
+
+    assert get_session_factory() is factory
+    assert factory.kw["expire_on_commit"] is False
+    async with factory() as session:
+        assert isinstance(session, AsyncSession)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///data/app.db", "sqlite+aiosqlite:///{cwd}/data/app.db"),
+        ("sqlite+aiosqlite:///data/app.db?mode=ro", "sqlite+aiosqlite:///{cwd}/data/app.db?mode=ro"),
+        ("sqlite+aiosqlite:////var/app.db", "sqlite+aiosqlite:////var/app.db"),
+        ("sqlite+aiosqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+        ("postgres://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+    ],
+    ids=["relative", "query-kept", "absolute", "memory", "postgres"],
+)
+def test_normalize_database_url(url, expected, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert _normalize_database_url(url) == expected.format(cwd=tmp_path.resolve())
@@ -1,9 +1,12 @@
 """Tests for dedup title fuzzy blocking (AQV-38)."""
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
+from app.models.raw_event import RawEvent
+from app.models.unique_event import UniqueEvent
 from app.services.enrichment import (
     FUZZY_TITLE_THRESHOLD,
     LLM_MATCH_CONFIDENCE_THRESHOLD,
@@ -55,11 +58,23 @@ def test_fuzzy_title_match_sao_jose_feminicidio_pair():
     assert fuzzy_title_match(a, b, threshold=FUZZY_TITLE_THRESHOLD)
 
 
-@pytest.mark.asyncio
-async def test_block_by_title_fuzzy_finds_similar_event(async_session):
-    from app.models.unique_event import UniqueEvent
-    from app.models.raw_event import RawEvent
+class _TestSessionMaker:
+    def __init__(self, session):
+        self._session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
+
+@pytest.fixture
+async def seeded_unique_event(async_session):
+    """One unique_event that the title-blocking queries should find."""
     unique = UniqueEvent(
         title="Tiroteio deixa dois mortos na Zona Norte do Rio",
         event_date=datetime(2025, 1, 15),
@@ -69,9 +84,12 @@ async def test_block_by_title_fuzzy_finds_similar_event(async_session):
         source_count=1,
     )
     async_session.add(unique)
-    await async_session.commit()
-    await async_session.refresh(unique)
+    await async_session.flush()
+    return unique
+
 
+@pytest.mark.asyncio
+async def test_block_by_title_fuzzy_finds_similar_event(async_session, seeded_unique_event):
     raw = RawEvent(
         title="Tiroteio deixa 2 mortos na Zona Norte",
         event_date=datetime(2025, 1, 16),
@@ -81,67 +99,24 @@ async def test_block_by_title_fuzzy_finds_similar_event(async_session):
         source_google_news_id=1,
     )
 
-    from unittest.mock import patch
-
-    class _TestSessionMaker:
-        def __init__(self, session):
-            self._session = session
-
-        def __call__(self):
-            return self
-
-        async def __aenter__(self):
-            return self._session
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
     with patch("app.services.enrichment.async_session_maker", _TestSessionMaker(async_session)):
         candidates = await block_by_title_fuzzy(raw)
 
     assert len(candidates) == 1
-    assert candidates[0].id == unique.id
+    assert candidates[0].id == seeded_unique_event.id
 
 
 @pytest.mark.asyncio
-async def test_block_by_title_fuzzy_respects_date_window(async_session):
-    from app.models.unique_event import UniqueEvent
-    from app.models.raw_event import RawEvent
-    from unittest.mock import patch
-
-    unique = UniqueEvent(
-        title="Homicidio em Juiz de Fora deixa um morto",
-        event_date=datetime(2025, 1, 1),
-        city="Juiz de Fora",
-        state="MG",
-        victim_count=1,
-        source_count=1,
-    )
-    async_session.add(unique)
-    await async_session.commit()
-
+async def test_block_by_title_fuzzy_respects_date_window(async_session, seeded_unique_event):
     raw = RawEvent(
-        title="Homicidio em Juiz de Fora deixa um morto",
-        event_date=datetime(2025, 1, 10),
-        city="Juiz de Fora",
-        state="MG",
-        victim_count=1,
+        title="Tiroteio deixa dois mortos na Zona Norte do Rio",
+        event_date=datetime(2025, 1, 25),
+        city="Rio de Janeiro",
+        state="RJ",
+        victim_count=2,
         source_google_news_id=1,
     )
 
-    class _TestSessionMaker:
-        def __init__(self, session):
-            self._session = session
-
-        def __call__(self):
-            return self
-
-        async def __aenter__(self):
-            return self._session
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
     with patch("app.services.enrichment.async_session_maker", _TestSessionMaker(async_session)):
         candidates = await block_by_title_fuzzy(raw)
 
@@ -9,14 +9,16 @@ from app.services.enrichment import (
     pre_cluster_by_victim_name,
 )
 
+_FEMINICIDE_DESCRIPTION = (
+    "A vítima Daiany Rodrigues de Souza, 33 anos, foi morta a facadas "
+    "pelo namorado José da Cruz Evangelista em um bar."
+)
+
 
 def test_extract_victim_names_from_description_when_json_empty():
     raw = RawEvent(
         title="Feminicídio em Confresa",
-        chronological_description=(
-            "A vítima Daiany Rodrigues de Souza, 33 anos, foi morta a facadas "
-            "pelo namorado José da Cruz Evangelista em um bar."
-        ),
+        chronological_description=_FEMINICIDE_DESCRIPTION,
         extraction_data={"victims": {"identifiable_victims": []}},
         source_google_news_id=1,
     )
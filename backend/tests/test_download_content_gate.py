@@ -1,12 +1,19 @@
 """Tests for post-download content gate wiring (AQV-32)."""
 
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import NamedTuple
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from app.models.source_google_news import SourceStatus
 from app.services.classification import ViolentDeathClassification
 from app.services.download import DownloadOutcome, download_source_content
-from app.services import diagnostics
+from app.services import diagnostics, download
+
+pytestmark = pytest.mark.usefixtures("inline_to_thread")
 
 
 class _TestSessionMaker:
@@ -31,18 +38,51 @@ def download_db(async_session):
             yield async_session
 
 
-def _source(**kwargs):
-    from app.models.source_google_news import SourceGoogleNews, SourceStatus
+_SOURCE_DEFAULTS = {
+    "google_news_url": "https://news.example/article",
+    "resolved_url": "https://news.example/article",
+    "headline": "Homem é morto a tiros em operação policial",
+    "status": SourceStatus.ready_for_download,
+}
+
+
+@pytest.fixture
+def add_source(make_source):
+    return partial(make_source, **_SOURCE_DEFAULTS)
+
+
+_HTML = "<html><body>article</body></html>"
 
-    defaults = {
-        "google_news_id": "download-test",
-        "google_news_url": "https://news.example/article",
-        "resolved_url": "https://news.example/article",
-        "headline": "Homem é morto a tiros em operação policial",
-        "status": SourceStatus.ready_for_download,
-    }
-    defaults.update(kwargs)
-    return SourceGoogleNews(**defaults)
+
+@contextmanager
+def _serve_article(extracted: tuple[str, dict | None]):
+    """Stub the fetch and trafilatura's (content, metadata) for a downloaded page."""
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch(
+                "app.services.download._fetch_html",
+                new=AsyncMock(return_value=(200, _HTML)),
+            )
+        )
+        stack.enter_context(
+            patch(
+                "app.services.download.extract_content_and_metadata",
+                return_value=extracted,
+            )
+        )
+        yield
+
+
+class _AttemptSpy:
+    """Records only what the tests read from diagnostics.record_attempt calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.last_kwargs: dict | None = None
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+        self.last_kwargs = kwargs
 
 
 def _classification(**kwargs) -> ViolentDeathClassification:
@@ -56,121 +96,143 @@ def _classification(**kwargs) -> ViolentDeathClassification:
     return ViolentDeathClassification(**defaults)
 
 
-@pytest.mark.asyncio
-async def test_download_discards_heuristic_aggregate(download_db):
-    from app.models.source_google_news import SourceStatus
+class _DiscardCase(NamedTuple):
+    headline: str
+    content: str
+    classification: ViolentDeathClassification | None
+    reasoning_marker: str
+    failure_reason: str
 
-    source = _source(
-        google_news_id="heuristic-discard",
+
+_DISCARD_CASES = {
+    "heuristic-aggregate": _DiscardCase(
         headline="Operação policial deixa mortos",
-    )
-    download_db.add(source)
-    await download_db.commit()
-    await download_db.refresh(source)
+        content=(
+            "O CVLI registrou 4.241 mortes violentas em 2025 em todo o estado, "
+            "segundo balanço anual divulgado pelo governo."
+        ),
+        classification=None,
+        reasoning_marker="content_gate=heuristic",
+        failure_reason=diagnostics.AGGREGATE_CONTENT,
+    ),
+    "llm-rejection": _DiscardCase(
+        headline="Tiroteio deixa mortos",
+        content=(
+            "Autoridades divulgaram dados sobre violência urbana em várias regiões "
+            "do país durante coletiva nesta terça-feira."
+        ),
+        classification=_classification(
+            is_single_incident=False,
+            content_class_hint="aggregate_statistics",
+            reasoning="Article is a statistics roundup",
+        ),
+        reasoning_marker="content_gate=llm",
+        failure_reason=diagnostics.LLM_CONTENT_REJECT,
+    ),
+}
 
-    html = "<html><body>article</body></html>"
-    aggregate_content = (
-        "O CVLI registrou 4.241 mortes violentas em 2025 em todo o estado, "
-        "segundo balanço anual divulgado pelo governo."
-    )
 
-    with patch(
-        "app.services.download._fetch_html",
-        new=AsyncMock(return_value=(200, html)),
-    ), patch(
-        "app.services.download.extract_content_and_metadata",
-        return_value=(aggregate_content, None),
-    ), patch(
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case", _DISCARD_CASES.values(), ids=_DISCARD_CASES.keys())
+async def test_download_content_gate_discards_non_incident(download_db, add_source, case):
+    source = await add_source(headline=case.headline)
+    record_spy = _AttemptSpy()
+
+    with _serve_article((case.content, None)), patch(
         "app.services.download.classify_article_content",
+        return_value=case.classification,
     ) as mock_llm, patch(
         "app.services.download.diagnostics.record_attempt",
-        new=AsyncMock(),
-    ) as mock_record:
+        new=record_spy,
+    ):
         outcome = await download_source_content(source.id)
 
     assert outcome == DownloadOutcome.discarded
-    mock_llm.assert_not_called()
+    # The heuristic decides aggregate pages without asking the LLM.
+    assert mock_llm.called is (case.classification is not None)
     await download_db.refresh(source)
     assert source.status == SourceStatus.discarded
-    assert "content_gate=heuristic" in source.classification_reasoning
-    mock_record.assert_called_once()
-    assert mock_record.call_args.kwargs["outcome"] == diagnostics.OUTCOME_DISCARDED
+    assert case.reasoning_marker in source.classification_reasoning
+    assert record_spy.calls == 1
+    assert record_spy.last_kwargs["outcome"] == diagnostics.OUTCOME_DISCARDED
+    assert record_spy.last_kwargs["failure_reason"] == case.failure_reason
 
 
 @pytest.mark.asyncio
-async def test_download_passes_incident_to_extraction(download_db):
-    from app.models.source_google_news import SourceStatus
-
-    source = _source(google_news_id="incident-pass")
-    download_db.add(source)
-    await download_db.commit()
-    await download_db.refresh(source)
-
-    html = "<html><body>article</body></html>"
-    incident_content = (
+async def test_download_content_gate_passes_single_incident(download_db, add_source):
+    source = await add_source(headline="Homem é morto a tiros em operação policial")
+    content = (
         "Um homem foi morto a tiros durante operação policial na Zona Norte "
         "do Rio de Janeiro. A polícia civil investiga o caso."
     )
 
-    with patch(
-        "app.services.download._fetch_html",
-        new=AsyncMock(return_value=(200, html)),
-    ), patch(
-        "app.services.download.extract_content_and_metadata",
-        return_value=(incident_content, None),
-    ), patch(
+    with _serve_article((content, None)), patch(
         "app.services.download.classify_article_content",
         return_value=_classification(),
+    ), patch(
+        "app.services.download.diagnostics.record_attempt",
+        new=_AttemptSpy(),
     ):
         outcome = await download_source_content(source.id)
 
     assert outcome == DownloadOutcome.ready_for_extraction
     await download_db.refresh(source)
     assert source.status == SourceStatus.ready_for_extraction
-    assert incident_content in source.content
+    assert content in source.content
 
 
-@pytest.mark.asyncio
-async def test_download_discards_llm_rejection(download_db):
-    from app.models.source_google_news import SourceStatus
+def test_extract_content_keeps_article_body(extracted_article):
+    content, _ = extracted_article
+    assert "morto a tiros na madrugada" in content
+    assert "Delegacia de Homicídios" in content
 
-    source = _source(
-        google_news_id="llm-discard",
-        headline="Tiroteio deixa mortos",
-    )
-    download_db.add(source)
-    await download_db.commit()
-    await download_db.refresh(source)
 
-    html = "<html><body>article</body></html>"
-    ambiguous_content = (
-        "Autoridades divulgaram dados sobre violência urbana em várias regiões "
-        "do país durante coletiva nesta terça-feira."
+def test_extract_content_drops_page_chrome(extracted_article):
+    content, metadata = extracted_article
+    assert "Todos os direitos reservados" not in content
+    assert metadata["text"] == content
+
+
+class _PageStream(httpx.AsyncByteStream):
+    """Response body that records whether anyone pulled it off the wire."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.read = False
+
+    async def __aiter__(self):
+        self.read = True
+        yield self.body
+
+
+@pytest.fixture
+def article_server(monkeypatch):
+    """Serve article pages from an in-process transport; returns the paywall body."""
+    real_client = httpx.AsyncClient
+    paywall = _PageStream("<html>assine já</html>".encode())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/paywall":
+            return httpx.Response(403, stream=paywall)
+        return httpx.Response(200, text=_HTML)
+
+    monkeypatch.setattr(
+        download.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
     )
+    return paywall
 
-    with patch(
-        "app.services.download._fetch_html",
-        new=AsyncMock(return_value=(200, html)),
-    ), patch(
-        "app.services.download.extract_content_and_metadata",
-        return_value=(ambiguous_content, None),
-    ), patch(
-        "app.services.download.classify_article_content",
-        return_value=_classification(
-            is_single_incident=False,
-            content_class_hint="aggregate_statistics",
-            reasoning="Article is a statistics roundup",
-        ),
-    ), patch(
-        "app.services.download.diagnostics.record_attempt",
-        new=AsyncMock(),
-    ) as mock_record:
-        outcome = await download_source_content(source.id)
 
-    assert outcome == DownloadOutcome.discarded
-    await download_db.refresh(source)
-    assert source.status == SourceStatus.discarded
-    assert "content_gate=llm" in source.classification_reasoning
-    mock_record.assert_called_once()
-    assert mock_record.call_args.kwargs["outcome"] == diagnostics.OUTCOME_DISCARDED
-    assert mock_record.call_args.kwargs["failure_reason"] == diagnostics.LLM_CONTENT_REJECT
+@pytest.mark.asyncio
+async def test_fetch_html_returns_page_text(article_server):
+    assert await download._fetch_html("https://news.example/article") == (200, _HTML)
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_raises_on_error_status_without_reading_body(article_server):
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await download._fetch_html("https://news.example/paywall")
+
+    assert excinfo.value.response.status_code == 403
+    assert article_server.read is False
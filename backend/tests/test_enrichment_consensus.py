@@ -1,15 +1,22 @@
 """Tests for enrichment raw-field consensus and pre-cluster title overlap."""
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
 
 from app.models.raw_event import RawEvent
 from app.services.enrichment import (
     EnrichmentResult,
     apply_raw_field_consensus,
+    coerce_json_field,
     fuzzy_title_match,
+    merged_data_param,
+    parse_datetime,
     pre_cluster_by_victim_name,
 )
 
+_MERGED_DATA_TEXT = '{"victims": [{"name": "João Silva"}], "city": "Contagem"}'
+
 
 class _Row:
     def __init__(self, **kwargs):
@@ -77,3 +84,56 @@ def test_apply_raw_field_consensus_city_majority():
     ]
     merged = apply_raw_field_consensus(result, rows)
     assert merged.city == "Rio Branco"
+
+
+def test_coerce_json_field_parses_sqlite_text():
+    assert coerce_json_field(_MERGED_DATA_TEXT) == {
+        "victims": [{"name": "João Silva"}],
+        "city": "Contagem",
+    }
+
+
+def test_coerce_json_field_passthrough_and_invalid():
+    payload = {"city": "Contagem"}
+    assert coerce_json_field(payload) is payload
+    assert coerce_json_field("{not json") is None
+    assert coerce_json_field(None) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-01-15 10:30:00.123456", datetime(2024, 1, 15, 10, 30, 0, 123456)),
+        ("2024-01-15 10:30:00", datetime(2024, 1, 15, 10, 30)),
+        ("2024-01-15", datetime(2024, 1, 15)),
+        (
+            "2024-01-15T10:30:00Z",
+            datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+        ),
+        (
+            "2024-01-15T10:30:00-03:00",
+            datetime(2024, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=-3))),
+        ),
+        (datetime(2024, 1, 15), datetime(2024, 1, 15)),
+        ("not a date", None),
+        ("", None),
+        (None, None),
+        (20240115, None),
+    ],
+)
+def test_parse_datetime(value, expected):
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("current", "new", "expected"),
+    [
+        (_MERGED_DATA_TEXT, {"victims": [{"name": "João Silva"}], "city": "Contagem"}, None),
+        ({"city": "Contagem"}, {"city": "Contagem"}, None),
+        (_MERGED_DATA_TEXT, {"city": "Betim"}, '{"city": "Betim"}'),
+        (None, {"city": "Betim"}, '{"city": "Betim"}'),
+        (_MERGED_DATA_TEXT, None, None),
+    ],
+)
+def test_merged_data_param_skips_unchanged_payload(current, new, expected):
+    assert merged_data_param(current, new) == expected
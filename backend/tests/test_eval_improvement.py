@@ -1,11 +1,14 @@
 """Tests for eval improvement loop helpers."""
 
 import json
+import shutil
 import sqlite3
 
+import pytest
+
 from eval.compare import compare_case_results, compare_generic_reports
 from eval.improvement.detect import parse_stages
-from eval.improvement.analysis import analyze_cluster, weighted_score
+from eval.improvement.analysis import weighted_score
 from eval.improvement.diagnose import build_diagnosis
 from eval.improvement.examples import build_fix_examples, _highlight_overlap
 from eval.improvement.review import build_review_markdown, emit_review_for_output
@@ -61,7 +64,10 @@ def test_compare_generic_reports(tmp_path):
     assert len(result["regressions"]) == 1
 
 
-def _make_snapshot_db(path):
+@pytest.fixture(scope="module")
+def _snapshot_template(tmp_path_factory):
+    """Build the prod-snapshot SQLite file once for the module."""
+    path = tmp_path_factory.mktemp("snapshot") / "snap.db"
     conn = sqlite3.connect(path)
     conn.execute(
         "CREATE TABLE unique_event (id INTEGER PRIMARY KEY, title TEXT, city TEXT, "
@@ -77,11 +83,17 @@ def _make_snapshot_db(path):
     )
     conn.commit()
     conn.close()
+    return path
+
+
+@pytest.fixture
+def snapshot_db(tmp_path, _snapshot_template):
+    """Per-test copy of the snapshot, so tests that insert rows stay isolated."""
+    return shutil.copy(_snapshot_template, tmp_path / "snap.db")
 
 
-def test_build_review_markdown_dedup_match(tmp_path):
-    db_path = tmp_path / "snap.db"
-    _make_snapshot_db(db_path)
+def test_build_review_markdown_dedup_match(snapshot_db):
+    db_path = snapshot_db
     candidate = AnomalyCandidate(
         stage="dedup-match",
         candidate_id="prod-dedup_match-9722-9723",
@@ -100,9 +112,8 @@ def test_build_review_markdown_dedup_match(tmp_path):
     assert "## Candidate appendix" in md
 
 
-def test_emit_review_for_output_candidates(tmp_path):
-    db_path = tmp_path / "snap.db"
-    _make_snapshot_db(db_path)
+def test_emit_review_for_output_candidates(tmp_path, snapshot_db):
+    db_path = snapshot_db
     candidates_path = tmp_path / "candidates.json"
     bundle = CandidateBundle(
         meta={"date_from": "2026-07-03", "date_to": "2026-07-07"},
@@ -240,9 +251,8 @@ def test_build_diagnosis_includes_fix_recommendations():
     assert "process_pending_deduplication" in cluster.recommended_change or cluster.recommended_change
 
 
-def test_review_markdown_includes_diagnosis_section(tmp_path):
-    db_path = tmp_path / "snap.db"
-    _make_snapshot_db(db_path)
+def test_review_markdown_includes_diagnosis_section(snapshot_db):
+    db_path = snapshot_db
     candidate = AnomalyCandidate(
         stage="dedup-match",
         candidate_id="prod-dedup_match-9722-9723",
@@ -275,11 +285,9 @@ def test_highlight_overlap_finds_victim_name():
     assert "Celeste" in result
 
 
-def test_build_fix_examples_dedup_match(tmp_path):
-    db_path = tmp_path / "snap.db"
-    _make_snapshot_db(db_path)
+def test_build_fix_examples_dedup_match(snapshot_db):
+    db_path = snapshot_db
     # add third UE for richer example
-    import sqlite3
     conn = sqlite3.connect(db_path)
     conn.execute(
         "INSERT INTO unique_event VALUES (9730, 'Homicídio Aarão Reis', "
@@ -1,7 +1,6 @@
 """Tests for CSV export column selection."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from decimal import Decimal
@@ -10,13 +9,7 @@ from httpx import AsyncClient
 from app.models.unique_event import UniqueEvent
 
 
-@pytest.fixture(autouse=True)
-def bypass_export_rate_limit():
-    with patch(
-        "app.services.geocode_protection.enforce_export_rate_limit",
-        AsyncMock(return_value=None),
-    ):
-        yield
+pytestmark = pytest.mark.usefixtures("no_export_rate_limit")
 
 
 @pytest.mark.asyncio
@@ -34,7 +27,7 @@ async def test_export_filters_columns(app, async_session, client: AsyncClient):
         source_count=1,
     )
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
 
     response = await client.get(
         "/api/public/events/export",
@@ -69,7 +62,7 @@ async def test_export_includes_context_columns(app, async_session, client: Async
         source_count=1,
     )
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
 
     response = await client.get(
         "/api/public/events/export",
@@ -1,7 +1,6 @@
 """Tests for CSV export date range filtering."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from decimal import Decimal
@@ -10,13 +9,7 @@ from httpx import AsyncClient
 from app.models.unique_event import UniqueEvent
 
 
-@pytest.fixture(autouse=True)
-def bypass_export_rate_limit():
-    with patch(
-        "app.services.geocode_protection.enforce_export_rate_limit",
-        AsyncMock(return_value=None),
-    ):
-        yield
+pytestmark = pytest.mark.usefixtures("no_export_rate_limit")
 
 
 @pytest.mark.asyncio
@@ -39,7 +32,7 @@ async def test_export_filters_by_date_range(app, async_session, client: AsyncCli
     )
     async_session.add(inside)
     async_session.add(outside)
-    await async_session.commit()
+    await async_session.flush()
 
     response = await client.get(
         "/api/public/events/export",
@@ -79,7 +72,7 @@ async def test_export_without_date_range_uses_days_window(app, async_session, cl
     )
     async_session.add(recent)
     async_session.add(old)
-    await async_session.commit()
+    await async_session.flush()
 
     response = await client.get("/api/public/events/export", params={"days": 365})
     assert response.status_code == 200
@@ -13,6 +13,7 @@ from tests.test_geocode_protection import FakeRedis
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("no_export_rate_limit")
 async def test_export_default_excludes_internal_columns(app, async_session, client: AsyncClient):
     event = UniqueEvent(
         title="Public event",
@@ -28,13 +29,9 @@ async def test_export_default_excludes_internal_columns(app, async_session, clie
         enrichment_model="gemini",
     )
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
 
-    with patch(
-        "app.services.geocode_protection.enforce_export_rate_limit",
-        AsyncMock(return_value=None),
-    ):
-        response = await client.get("/api/public/events/export")
+    response = await client.get("/api/public/events/export")
 
     assert response.status_code == 200
     header = response.text.splitlines()[0]
@@ -47,40 +44,32 @@ async def test_export_default_excludes_internal_columns(app, async_session, clie
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("no_export_rate_limit")
 async def test_export_rejects_internal_column_requests(client: AsyncClient):
-    with patch(
-        "app.services.geocode_protection.enforce_export_rate_limit",
-        AsyncMock(return_value=None),
-    ):
-        response = await client.get(
-            "/api/public/events/export",
-            params={"columns": ["merged_data", "place_id"]},
-        )
+    response = await client.get(
+        "/api/public/events/export",
+        params={"columns": ["merged_data", "place_id"]},
+    )
     assert response.status_code == 400
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("no_export_rate_limit")
 async def test_export_json_sets_truncated_header(app, async_session, client: AsyncClient):
-    for index in range(3):
-        async_session.add(
-            UniqueEvent(
-                title=f"Event {index}",
-                event_date=datetime.utcnow(),
-                state="RJ",
-                city="Niterói",
-                latitude=Decimal("-22.8832"),
-                longitude=Decimal("-43.1034"),
-            )
+    events = [
+        UniqueEvent(
+            title=f"Event {index}",
+            event_date=datetime.utcnow(),
+            state="RJ",
+            city="Niterói",
+            latitude=Decimal("-22.8832"),
+            longitude=Decimal("-43.1034"),
         )
-    await async_session.commit()
-
-    with (
-        patch.object(public_router, "EXPORT_MAX_ROWS", 2),
-        patch(
-            "app.services.geocode_protection.enforce_export_rate_limit",
-            AsyncMock(return_value=None),
-        ),
-    ):
+        for index in range(3)
+    ]
+    await async_session.run_sync(lambda session: session.bulk_save_objects(events))
+
+    with patch.object(public_router, "EXPORT_MAX_ROWS", 2):
         response = await client.get("/api/public/events/export", params={"format": "json"})
 
     assert response.status_code == 200
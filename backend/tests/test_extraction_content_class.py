@@ -1,9 +1,12 @@
 """Tests for extraction content_class and event taxonomy (AQV-33)."""
 
-from unittest.mock import AsyncMock, patch
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
+from app.models.source_google_news import SourceStatus
 from app.services.extraction import content_class_failure_reason, extract_source
 from app.services.extraction_schemas import (
     DateTime,
@@ -16,6 +19,8 @@ from app.services.extraction_schemas import (
 )
 from app.services import diagnostics
 
+pytestmark = pytest.mark.usefixtures("inline_to_thread")
+
 
 class _TestSessionMaker:
     def __init__(self, session):
@@ -31,12 +36,30 @@ class _TestSessionMaker:
         return False
 
 
+@pytest.fixture(scope="module")
+def extraction_mocks():
+    """Patch the LLM call and attempt bookkeeping once for the whole module."""
+    with patch.multiple(
+        "app.services.extraction", extract_event_from_content=DEFAULT
+    ) as extraction, patch.multiple(
+        "app.services.diagnostics", count_attempts=DEFAULT, record_attempt=DEFAULT
+    ) as attempts:
+        yield SimpleNamespace(**extraction, **attempts)
+
+
+@pytest.fixture(autouse=True)
+def _reset_extraction_mocks(extraction_mocks):
+    for mock in vars(extraction_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    extraction_mocks.count_attempts.return_value = 0
+
+
 @pytest.fixture
 def extraction_db(async_session):
-    maker = _TestSessionMaker(async_session)
-    with patch("app.services.extraction.async_session_maker", maker):
-        with patch("app.services.diagnostics.async_session_maker", maker):
-            yield async_session
+    # diagnostics.count_attempts/record_attempt are mocked module-wide, so only
+    # extraction's own session maker needs routing to the test session.
+    with patch("app.services.extraction.async_session_maker", _TestSessionMaker(async_session)):
+        yield async_session
 
 
 def _minimal_event(**kwargs) -> ViolentDeathEvent:
@@ -68,19 +91,18 @@ def _minimal_event(**kwargs) -> ViolentDeathEvent:
     return ViolentDeathEvent(**defaults)
 
 
-def _source(**kwargs):
-    from app.models.source_google_news import SourceGoogleNews, SourceStatus
+_SOURCE_DEFAULTS = {
+    "google_news_url": "https://news.example/article",
+    "resolved_url": "https://news.example/article",
+    "headline": "Homem é morto a tiros em operação policial",
+    "content": "Um homem foi morto a tiros durante operação policial.",
+    "status": SourceStatus.ready_for_extraction,
+}
 
-    defaults = {
-        "google_news_id": "extract-test",
-        "google_news_url": "https://news.example/article",
-        "resolved_url": "https://news.example/article",
-        "headline": "Homem é morto a tiros em operação policial",
-        "content": "Um homem foi morto a tiros durante operação policial.",
-        "status": SourceStatus.ready_for_extraction,
-    }
-    defaults.update(kwargs)
-    return SourceGoogleNews(**defaults)
+
+@pytest.fixture
+def add_source(make_source):
+    return partial(make_source, **_SOURCE_DEFAULTS)
 
 
 @pytest.mark.parametrize(
@@ -112,47 +134,71 @@ def test_content_class_failure_reason_mapping(content_class, expected_reason):
 
 
 @pytest.mark.asyncio
-async def test_extract_source_discards_non_incident_content_class(extraction_db):
-    from app.models.source_google_news import SourceStatus
-
-    source = _source(google_news_id="discard-foreign")
-    extraction_db.add(source)
-    await extraction_db.commit()
-    await extraction_db.refresh(source)
+async def test_extract_source_discards_non_incident_content_class(
+    extraction_db, add_source, extraction_mocks
+):
+    source = await add_source(google_news_id="discard-foreign")
 
     foreign_event = _minimal_event(content_class="foreign")
 
-    with patch(
-        "app.services.extraction.extract_event_from_content",
-        return_value=foreign_event,
-    ), patch(
-        "app.services.extraction.diagnostics.count_attempts",
-        new=AsyncMock(return_value=0),
-    ), patch(
-        "app.services.extraction.diagnostics.record_attempt",
-        new=AsyncMock(),
-    ) as mock_record:
-        result = await extract_source(source.id)
+    extraction_mocks.extract_event_from_content.return_value = foreign_event
+    result = await extract_source(source.id)
 
     assert result is None
-    await extraction_db.refresh(source)
+    await extraction_db.refresh(source, ["status", "classification_reasoning"])
     assert source.status == SourceStatus.discarded
     assert "content_class=foreign" in source.classification_reasoning
+    mock_record = extraction_mocks.record_attempt
     mock_record.assert_called_once()
     assert mock_record.call_args.kwargs["outcome"] == diagnostics.OUTCOME_DISCARDED
     assert mock_record.call_args.kwargs["failure_reason"] == diagnostics.FOREIGN_CONTENT
 
 
+class _SchemaValidationError(Exception):
+    """Stand-in for instructor's validation failure (matched by type name)."""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "status", "outcome", "failure_reason"),
+    [
+        (
+            Exception("429 RESOURCE_EXHAUSTED"),
+            SourceStatus.failed_in_extraction,
+            diagnostics.OUTCOME_FAILURE,
+            diagnostics.LLM_RATE_LIMIT,
+        ),
+        (
+            _SchemaValidationError("victims.number_of_victims: field required"),
+            SourceStatus.discarded,
+            diagnostics.OUTCOME_DISCARDED,
+            diagnostics.VALIDATION_ERROR,
+        ),
+    ],
+    ids=["rate-limited", "schema-validation"],
+)
+async def test_extract_source_llm_errors(
+    extraction_db, add_source, extraction_mocks, error, status, outcome, failure_reason
+):
+    source = await add_source()
+    extraction_mocks.extract_event_from_content.side_effect = error
+
+    assert await extract_source(source.id) is None
+
+    await extraction_db.refresh(source, ["status"])
+    assert source.status == status
+    kwargs = extraction_mocks.record_attempt.call_args.kwargs
+    assert kwargs["outcome"] == outcome
+    assert kwargs["failure_reason"] == failure_reason
+
+
 @pytest.mark.asyncio
-async def test_extract_source_persists_incident_with_taxonomy(extraction_db):
+async def test_extract_source_persists_incident_with_taxonomy(
+    extraction_db, add_source, extraction_mocks
+):
     from app.models.raw_event import RawEvent
-    from app.models.source_google_news import SourceStatus
-    from sqlmodel import select
 
-    source = _source(google_news_id="persist-incident")
-    extraction_db.add(source)
-    await extraction_db.commit()
-    await extraction_db.refresh(source)
+    source = await add_source(google_news_id="persist-incident")
 
     incident_event = _minimal_event(
         event_family="homicidio",
@@ -163,17 +209,8 @@ async def test_extract_source_persists_incident_with_taxonomy(extraction_db):
         ),
     )
 
-    with patch(
-        "app.services.extraction.extract_event_from_content",
-        return_value=incident_event,
-    ), patch(
-        "app.services.extraction.diagnostics.count_attempts",
-        new=AsyncMock(return_value=0),
-    ), patch(
-        "app.services.extraction.diagnostics.record_attempt",
-        new=AsyncMock(),
-    ):
-        raw_event = await extract_source(source.id)
+    extraction_mocks.extract_event_from_content.return_value = incident_event
+    raw_event = await extract_source(source.id)
 
     assert raw_event is not None
     assert raw_event.content_class == "incident"
@@ -181,10 +218,12 @@ async def test_extract_source_persists_incident_with_taxonomy(extraction_db):
     assert raw_event.event_subtype == "intervencao_policial"
     assert raw_event.homicide_type == "Intervenção policial"
 
-    await extraction_db.refresh(source)
+    await extraction_db.refresh(source, ["status"])
     assert source.status == SourceStatus.extracted
 
-    stored = (
-        await extraction_db.exec(select(RawEvent).where(RawEvent.id == raw_event.id))
-    ).one()
+    # populate_existing reloads the row from the database instead of trusting
+    # the identity map, which holds the service's own object.
+    stored = await extraction_db.get(RawEvent, raw_event.id, populate_existing=True)
     assert stored.content_class == "incident"
+    assert stored.event_family == "homicidio"
+    assert stored.event_subtype == "intervencao_policial"
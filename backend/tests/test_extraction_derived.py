@@ -47,6 +47,16 @@ def _base_event(**dynamic_kwargs) -> ViolentDeathEvent:
     )
 
 
+def _assert_public_fields(event: ViolentDeathEvent, **expected) -> None:
+    """Check a subset of derive_public_fields; types are compared so True != 1."""
+    fields = derive_public_fields(event)
+    actual = {key: fields[key] for key in expected}
+    assert actual == expected
+    assert {key: type(value) for key, value in actual.items()} == {
+        key: type(value) for key, value in expected.items()
+    }
+
+
 def test_derive_criminal_group_fields():
     event = _base_event(
         criminal_group_context=CriminalGroupContext(
@@ -56,11 +66,13 @@ def test_derive_criminal_group_fields():
             group_attacked="milícia",
         ),
     )
-    fields = derive_public_fields(event)
-    assert fields["criminal_group_connected"] is True
-    assert fields["criminal_group_activity"] == "territorial-dispute"
-    assert fields["criminal_groups"] == "Comando Vermelho; milícia"
-    assert fields["criminal_group_attacked"] == "milícia"
+    _assert_public_fields(
+        event,
+        criminal_group_connected=True,
+        criminal_group_activity="territorial-dispute",
+        criminal_groups="Comando Vermelho; milícia",
+        criminal_group_attacked="milícia",
+    )
 
 
 def test_derive_politician_victim_fields():
@@ -71,11 +83,13 @@ def test_derive_politician_victim_fields():
         office="vereador",
         party="PT",
     )
-    fields = derive_public_fields(event)
-    assert fields["politician_or_candidate_victim"] is True
-    assert fields["victim_political_status"] == "elected"
-    assert fields["victim_political_office"] == "vereador"
-    assert fields["victim_political_party"] == "PT"
+    _assert_public_fields(
+        event,
+        politician_or_candidate_victim=True,
+        victim_political_status="elected",
+        victim_political_office="vereador",
+        victim_political_party="PT",
+    )
 
 
 def test_derive_police_operation_and_off_duty():
@@ -89,11 +103,13 @@ def test_derive_police_operation_and_off_duty():
         off_duty_police_perpetrator=False,
         off_duty_police_context=None,
     )
-    fields = derive_public_fields(event)
-    assert fields["police_operation_connected"] is True
-    assert fields["police_operation_force"] == "PM"
-    assert fields["police_operation_targeted_armed_groups"] is True
-    assert fields["off_duty_police_perpetrator"] is False
+    _assert_public_fields(
+        event,
+        police_operation_connected=True,
+        police_operation_force="PM",
+        police_operation_targeted_armed_groups=True,
+        off_duty_police_perpetrator=False,
+    )
 
 
 def test_activity_implies_connected_when_null():
@@ -104,14 +120,12 @@ def test_activity_implies_connected_when_null():
             groups=["PCC"],
         ),
     )
-    fields = derive_public_fields(event)
-    assert fields["criminal_group_connected"] is True
-    assert fields["criminal_group_activity"] == "retaliatory"
+    _assert_public_fields(
+        event, criminal_group_connected=True, criminal_group_activity="retaliatory"
+    )
 
 
 def test_derive_security_force_victim_public_field():
     event = _base_event()
     event.victims.identifiable_victims[0].is_security_force = True
-    fields = derive_public_fields(event)
-    assert fields["security_force_victim"] is True
-    assert fields["security_force_involved"] is True
+    _assert_public_fields(event, security_force_victim=True, security_force_involved=True)
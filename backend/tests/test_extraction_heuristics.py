@@ -1,4 +1,9 @@
-"""Unit tests for extraction post-LLM heuristics."""
+"""Unit tests for extraction post-LLM heuristics.
+
+PYTEST_DONT_REWRITE: only scalar comparisons here, plain asserts are enough.
+"""
+
+import pytest
 
 from app.services.extraction_heuristics import (
     _norm,
@@ -107,8 +112,18 @@ def test_infer_fatal_victim_count_excludes_wounded():
     assert infer_fatal_victim_count(_norm(source)) == 3
 
 
-def test_normalize_date_string_strips_time():
-    assert normalize_date_string("2024-07-19T00:00:00") == "2024-07-19"
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-07-19T00:00:00", "2024-07-19"),
+        ("2024-07-19T13:45:00-03:00", "2024-07-19"),
+        ("2024-07-19", "2024-07-19"),
+        ("", ""),
+        (None, None),
+    ],
+)
+def test_normalize_date_string(value, expected):
+    assert normalize_date_string(value) == expected
 
 
 def test_apply_downgrades_false_qualificado():
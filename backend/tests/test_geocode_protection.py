@@ -1,15 +1,16 @@
 """Tests for geocode rate limiting and caching."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import HTTPException
 from httpx import ASGITransport, AsyncClient
 
-from app.main import create_app
 from app.services.geocode_protection import (
     enforce_geocode_rate_limit,
     get_cached_geocode,
+    get_client_ip,
     normalize_geocode_query,
 )
 
@@ -48,6 +49,22 @@ def fake_redis():
     return FakeRedis()
 
 
+@pytest.mark.parametrize(
+    ("forwarded", "expected"),
+    [
+        ("203.0.113.7, 10.0.0.2, 10.0.0.1", "203.0.113.7"),
+        (" 198.51.100.4 ", "198.51.100.4"),
+        (None, "127.0.0.1"),
+    ],
+    ids=["proxy-chain", "single-hop", "no-header"],
+)
+def test_get_client_ip_prefers_first_forwarded_hop(forwarded, expected):
+    headers = {"x-forwarded-for": forwarded} if forwarded else {}
+    request = SimpleNamespace(headers=headers, client=SimpleNamespace(host="127.0.0.1"))
+
+    assert get_client_ip(request) == expected
+
+
 def test_normalize_geocode_query_handles_case_and_whitespace():
     assert normalize_geocode_query("  São   Paulo  ") == "são paulo"
     assert normalize_geocode_query("RIO DE JANEIRO") == "rio de janeiro"
@@ -92,19 +109,17 @@ async def test_enforce_geocode_rate_limit_blocks_over_limit(fake_redis):
 
 
 @pytest.mark.asyncio
-async def test_geocode_endpoint_uses_cache(fake_redis):
+async def test_geocode_endpoint_uses_cache(fake_redis, _session_app):
     fake_redis.store["geocode:cache:são paulo"] = (
         '{"latitude": -23.5, "longitude": -46.6, "label": "São Paulo", '
         '"source": "cache", "query": "São Paulo", "zoom": 10}'
     )
-    app = create_app()
-
     with patch(
         "app.services.geocode_protection._get_redis",
         AsyncMock(return_value=fake_redis),
     ):
         async with AsyncClient(
-            transport=ASGITransport(app=app),
+            transport=ASGITransport(app=_session_app),
             base_url="http://test",
         ) as client:
             response = await client.get("/api/public/geocode", params={"q": "São Paulo"})
@@ -114,16 +129,14 @@ async def test_geocode_endpoint_uses_cache(fake_redis):
 
 
 @pytest.mark.asyncio
-async def test_geocode_endpoint_returns_429_when_rate_limited(fake_redis):
+async def test_geocode_endpoint_returns_429_when_rate_limited(fake_redis, _session_app):
     fake_redis.counters["geocode:rate:127.0.0.1"] = 31
-    app = create_app()
-
     with patch(
         "app.services.geocode_protection._get_redis",
         AsyncMock(return_value=fake_redis),
     ):
         async with AsyncClient(
-            transport=ASGITransport(app=app),
+            transport=ASGITransport(app=_session_app),
             base_url="http://test",
         ) as client:
             response = await client.get("/api/public/geocode", params={"q": "Curitiba"})
@@ -0,0 +1,57 @@
+"""Tests for the public free-form geocoding lookup."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import app.services.geocoding as geocoding
+
+
+@pytest.fixture
+def geocode_requests(monkeypatch):
+    """Route every AsyncClient the module opens through one recording transport."""
+    seen: list[httpx.Request] = []
+    clients: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.host == "viacep.com.br":
+            return httpx.Response(
+                200,
+                json={"logradouro": "Rua da Conceição", "localidade": "Niterói", "uf": "RJ"},
+            )
+        return httpx.Response(
+            200,
+            json=[{"lat": "-22.89", "lon": "-43.12", "display_name": "Niterói", "type": "road"}],
+        )
+
+    def make_client(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(geocoding.httpx, "AsyncClient", make_client)
+    monkeypatch.setattr(geocoding, "get_settings", lambda: SimpleNamespace(google_maps_api_key=None))
+    return SimpleNamespace(requests=seen, clients=clients)
+
+
+@pytest.mark.asyncio
+async def test_cep_lookup_reuses_one_client_across_hops(geocode_requests):
+    result = await geocoding.geocode_user_query("24020-085")
+
+    assert result["source"] == "nominatim"
+    assert [request.url.host for request in geocode_requests.requests] == [
+        "viacep.com.br",
+        "nominatim.openstreetmap.org",
+    ]
+    assert geocode_requests.requests[1].url.params["q"] == "Rua da Conceição, Niterói, RJ, Brasil"
+    assert len(geocode_requests.clients) == 1
+    assert geocode_requests.clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_country_query_skips_http(geocode_requests):
+    assert await geocoding.geocode_user_query("Brasil") == geocoding.BRAZIL_COUNTRY_RESULT
+    assert geocode_requests.clients == []
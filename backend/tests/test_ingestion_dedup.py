@@ -1,11 +1,14 @@
 """Tests for duplicate google_news_id handling during city ingest."""
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlmodel import select
 
+import app.services.ingestion as ingestion
 from app.models.source_google_news import SourceGoogleNews, SourceStatus
 from app.services.ingestion import ingest_city
 
@@ -20,8 +23,45 @@ def _entry(*, entry_id: str, link: str, title: str = "Headline - Publisher"):
     }
 
 
+def _payload(entries, *, url="https://news.google.com/rss/search?q=query", not_modified=False):
+    """Stand-in for FeedPayload carrying already-parsed entries."""
+    return SimpleNamespace(
+        url=url,
+        entries=entries,
+        not_modified=not_modified,
+        validators={} if not_modified else {"If-None-Match": f'"{url}"'},
+    )
+
+
+class _SessionMaker:
+    def __init__(self, session):
+        self._session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _patch_ingest_deps(monkeypatch, session, entries, *, resolved_urls):
+    """Route ingest_city to the test session and a canned feed via monkeypatch."""
+    resolve = MagicMock(side_effect=list(resolved_urls))
+    for name, value in {
+        "async_session_maker": _SessionMaker(session),
+        "get_queries_for_city": AsyncMock(return_value=["query"]),
+        "rate_limited_fetch": AsyncMock(return_value=_payload(entries)),
+        "update_city_stats": AsyncMock(),
+        "resolve_google_news_url": resolve,
+    }.items():
+        monkeypatch.setattr(ingestion, name, value)
+
+
 @pytest.mark.asyncio
-async def test_ingest_city_skips_existing_google_news_id(async_session):
+async def test_ingest_city_skips_existing_google_news_id(async_session, monkeypatch):
     existing = SourceGoogleNews(
         google_news_id="dup-id",
         google_news_url="https://news.google.com/existing",
@@ -30,39 +70,14 @@ async def test_ingest_city_skips_existing_google_news_id(async_session):
         fetched_at=datetime.utcnow(),
     )
     async_session.add(existing)
-    await async_session.commit()
-
-    class _SessionMaker:
-        def __call__(self):
-            return self
-
-        async def __aenter__(self):
-            return async_session
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+    await async_session.flush()
 
     entries = [_entry(entry_id="dup-id", link="https://news.google.com/new")]
+    _patch_ingest_deps(
+        monkeypatch, async_session, entries, resolved_urls=["https://article.example/1"]
+    )
 
-    with (
-        patch("app.services.ingestion.async_session_maker", _SessionMaker()),
-        patch(
-            "app.services.ingestion.get_queries_for_city",
-            new_callable=AsyncMock,
-            return_value=["query"],
-        ),
-        patch(
-            "app.services.ingestion.rate_limited_fetch",
-            new_callable=AsyncMock,
-            return_value=entries,
-        ),
-        patch("app.services.ingestion.update_city_stats", new_callable=AsyncMock),
-        patch(
-            "app.services.ingestion.resolve_google_news_url",
-            return_value="https://article.example/1",
-        ),
-    ):
-        new_sources, total = await ingest_city("Test City", when="1h", resolve_urls=True)
+    new_sources, total = await ingest_city("Test City", when="1h", resolve_urls=True)
 
     assert total == 1
     assert new_sources == []
@@ -74,17 +89,9 @@ async def test_ingest_city_skips_existing_google_news_id(async_session):
 
 
 @pytest.mark.asyncio
-async def test_ingest_city_continues_after_integrity_error_on_flush(async_session):
-    class _SessionMaker:
-        def __call__(self):
-            return self
-
-        async def __aenter__(self):
-            return async_session
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
+async def test_ingest_city_continues_after_integrity_error_on_flush(
+    async_session, monkeypatch
+):
     entries = [
         _entry(entry_id="race-id", link="https://news.google.com/race"),
         _entry(entry_id="ok-id", link="https://news.google.com/ok"),
@@ -101,29 +108,98 @@ async def test_ingest_city_continues_after_integrity_error_on_flush(async_sessio
             raise IntegrityError("duplicate", params=None, orig=Exception("dup"))
         return await real_flush(*args, **kwargs)
 
-    with (
-        patch("app.services.ingestion.async_session_maker", _SessionMaker()),
-        patch(
-            "app.services.ingestion.get_queries_for_city",
-            new_callable=AsyncMock,
-            return_value=["query"],
-        ),
-        patch(
-            "app.services.ingestion.rate_limited_fetch",
-            new_callable=AsyncMock,
-            return_value=entries,
-        ),
-        patch("app.services.ingestion.update_city_stats", new_callable=AsyncMock),
-        patch(
-            "app.services.ingestion.resolve_google_news_url",
-            side_effect=[
-                "https://article.example/race",
-                "https://article.example/ok",
-            ],
-        ),
-        patch.object(async_session, "flush", side_effect=flush_with_race),
-    ):
-        new_sources, _total = await ingest_city("Test City", when="1h", resolve_urls=True)
+    _patch_ingest_deps(
+        monkeypatch,
+        async_session,
+        entries,
+        resolved_urls=["https://article.example/race", "https://article.example/ok"],
+    )
+    monkeypatch.setattr(async_session, "flush", flush_with_race)
+
+    new_sources, _total = await ingest_city("Test City", when="1h", resolve_urls=True)
 
     assert len(new_sources) == 1
     assert new_sources[0].google_news_id == "ok-id"
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_cities_fetches_each_city_once(monkeypatch):
+    ingest = AsyncMock(return_value=([], 0))
+    monkeypatch.setattr(ingestion, "ingest_city", ingest)
+
+    summary = await ingestion.ingest_all_cities(
+        cities=["Niterói", "Maricá", "Niterói"], when="1h"
+    )
+
+    assert [call.args[0] for call in ingest.await_args_list] == ["Niterói", "Maricá"]
+    assert summary["cities_processed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ingest_city_fetches_shard_queries_concurrently(async_session, monkeypatch):
+    _patch_ingest_deps(monkeypatch, async_session, [], resolved_urls=[])
+    monkeypatch.setattr(
+        ingestion, "get_queries_for_city", AsyncMock(return_value=["shard-a", "shard-b"])
+    )
+    second_started = asyncio.Event()
+
+    async def fetch(query, when=None):
+        if query == "shard-a":
+            # Only completes if shard-b's fetch starts while this one is pending.
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+        else:
+            second_started.set()
+        return _payload([_entry(entry_id=f"{query}-id", link=f"https://news.google.com/{query}")])
+
+    monkeypatch.setattr(ingestion, "rate_limited_fetch", fetch)
+    monkeypatch.setattr(ingestion, "resolve_google_news_url", lambda url: None)
+
+    new_sources, total = await ingest_city("Test City", when="1h", resolve_urls=True)
+
+    assert total == 2
+    assert [source.search_query for source in new_sources] == ["shard-a", "shard-b"]
+    assert new_sources[0].fetched_at == new_sources[1].fetched_at
+
+
+@pytest.mark.asyncio
+async def test_ingest_city_records_feed_validators_after_saving_entries(async_session, monkeypatch):
+    entries = [_entry(entry_id="new-id", link="https://news.google.com/new")]
+    _patch_ingest_deps(monkeypatch, async_session, entries, resolved_urls=[None])
+    monkeypatch.setattr(ingestion, "_feed_validators", {})
+
+    await ingest_city("Test City", when="1h", resolve_urls=True)
+
+    assert ingestion._feed_validators == {
+        "https://news.google.com/rss/search?q=query": {
+            "If-None-Match": '"https://news.google.com/rss/search?q=query"'
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingest_city_skips_feed_validators_when_saving_fails(async_session, monkeypatch):
+    entries = [_entry(entry_id="new-id", link="https://news.google.com/new")]
+    _patch_ingest_deps(monkeypatch, async_session, entries, resolved_urls=[None])
+    monkeypatch.setattr(ingestion, "_feed_validators", {})
+    monkeypatch.setattr(
+        async_session, "commit", AsyncMock(side_effect=RuntimeError("database unavailable"))
+    )
+
+    with pytest.raises(RuntimeError):
+        await ingest_city("Test City", when="1h", resolve_urls=True)
+
+    # The next run must refetch the full body rather than get a 304.
+    assert ingestion._feed_validators == {}
+
+
+@pytest.mark.asyncio
+async def test_ingest_city_keeps_city_stats_when_feed_is_unchanged(async_session, monkeypatch):
+    _patch_ingest_deps(monkeypatch, async_session, [], resolved_urls=[])
+    monkeypatch.setattr(
+        ingestion, "rate_limited_fetch", AsyncMock(return_value=_payload([], not_modified=True))
+    )
+
+    new_sources, total = await ingest_city("Test City", when="1h", resolve_urls=True)
+
+    assert (new_sources, total) == ([], 0)
+    ingestion.update_city_stats.assert_not_awaited()
@@ -0,0 +1,273 @@
+"""Tests for Google News RSS helpers used by ingestion."""
+
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import app.services.ingestion as ingestion
+from app.services.ingestion import (
+    FeedPayload,
+    build_rss_url,
+    fetch_rss_feed,
+    fetch_rss_payload,
+    parse_headline_and_publisher,
+    parse_published_at,
+    rate_limited_fetch,
+    resolve_google_news_url,
+)
+
+GOOGLE_URL = "https://news.google.com/rss/articles/test123"
+
+# Hand-written feed with three synthetic items laid out like a Google News search
+# response, so feed tests never hit the network. It is not a recorded response.
+RSS_BODY = (Path(__file__).resolve().parent / "fixtures" / "google_news_rss.xml").read_bytes()
+
+RSS_CONTENT_TYPE = "application/rss+xml; charset=utf-8"
+RSS_ETAG = '"niteroi-1h-v1"'
+
+
+@pytest.fixture
+def rss_requests(monkeypatch):
+    """Serve RSS_BODY from an in-process transport and record each request."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.params.get("q", "").startswith("erro"):
+            return httpx.Response(503)
+        if request.headers.get("if-none-match") == RSS_ETAG:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=RSS_BODY,
+            headers={"content-type": RSS_CONTENT_TYPE, "etag": RSS_ETAG},
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ingestion, "_http_client", client)
+    monkeypatch.setattr(ingestion, "_feed_validators", {})
+    yield seen
+    client.close()
+
+
+@pytest.mark.parametrize(
+    ("query", "when", "expected"),
+    [
+        (
+            "homicídio Rio de Janeiro",
+            "7d",
+            "https://news.google.com/rss/search?q=homic%C3%ADdio+Rio+de+Janeiro+when:7d"
+            "&hl=pt-BR&gl=BR&ceid=BR:pt-419",
+        ),
+        (
+            "Niterói when:1h site:g1.globo.com",
+            None,
+            "https://news.google.com/rss/search?q=Niter%C3%B3i+when:1h+site:g1.globo.com"
+            "&hl=pt-BR&gl=BR&ceid=BR:pt-419",
+        ),
+    ],
+    ids=["city-query", "sharded-query"],
+)
+def test_build_rss_url_keeps_colons_unescaped(query, when, expected):
+    assert build_rss_url(query, when) == expected
+
+
+@pytest.fixture(scope="module")
+def decoder():
+    """One googlenewsdecoder patch for every resolve test in the module."""
+    with patch("app.services.ingestion.googlenewsdecoder") as mock:
+        yield mock
+
+
+@pytest.mark.parametrize(
+    ("decoded", "error", "expected"),
+    [
+        (
+            {"status": True, "decoded_url": "https://example.com/real"},
+            None,
+            "https://example.com/real",
+        ),
+        ({"status": False, "message": "rate limited"}, None, None),
+        (None, RuntimeError("decoder down"), None),
+    ],
+    ids=["decoded", "decoder-status-false", "decoder-raises"],
+)
+def test_resolve_google_news_url(decoder, decoded, error, expected):
+    decoder.new_decoderv1.reset_mock(return_value=True, side_effect=True)
+    decoder.new_decoderv1.return_value = decoded
+    decoder.new_decoderv1.side_effect = error
+
+    assert resolve_google_news_url(GOOGLE_URL) == expected
+    decoder.new_decoderv1.assert_called_once_with(GOOGLE_URL, interval=0.5)
+
+
+def test_resolve_google_news_url_passes_through_publisher_urls(decoder):
+    decoder.new_decoderv1.reset_mock()
+
+    assert resolve_google_news_url("https://g1.globo.com/rj/noticia.ghtml") == (
+        "https://g1.globo.com/rj/noticia.ghtml"
+    )
+    decoder.new_decoderv1.assert_not_called()
+
+
+def test_fetch_rss_feed_reuses_shared_client(rss_requests):
+    first = fetch_rss_feed("homicídio Niterói", when="1h")
+    second = fetch_rss_feed("tiroteio Niterói", when="1h")
+
+    assert first[0].title == "Homem morre baleado na Zona Norte de Niterói - G1"
+    assert len(first) == len(second) == 3
+    assert len(rss_requests) == 2
+    assert ingestion.get_http_client() is ingestion._http_client
+
+
+def test_fetch_rss_payload_revalidates_only_after_validators_are_recorded(rss_requests):
+    first = fetch_rss_payload("homicídio Niterói", when="1h")
+    assert first.validators == {"If-None-Match": RSS_ETAG}
+
+    # Nothing is recorded until the caller has saved the entries.
+    assert len(fetch_rss_payload("homicídio Niterói", when="1h").entries) == 3
+
+    ingestion._remember_feed_validators([first, None])
+    unchanged = fetch_rss_payload("homicídio Niterói", when="1h")
+
+    assert unchanged.not_modified
+    assert unchanged.entries == []
+    assert "if-none-match" not in rss_requests[1].headers
+    assert rss_requests[2].headers["if-none-match"] == RSS_ETAG
+
+
+def test_feed_client_advertises_compression(monkeypatch):
+    monkeypatch.setattr(ingestion, "_http_client", None)
+    try:
+        assert "gzip" in ingestion.get_http_client().headers["accept-encoding"]
+    finally:
+        ingestion.close_http_client()
+
+
+def test_fetch_rss_payload_decodes_gzip_body(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=gzip.compress(RSS_BODY),
+            headers={"content-type": RSS_CONTENT_TYPE, "content-encoding": "gzip"},
+        )
+
+    monkeypatch.setattr(ingestion, "_feed_validators", {})
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        monkeypatch.setattr(ingestion, "_http_client", client)
+        payload = fetch_rss_payload("homicídio Niterói", when="1h")
+
+    assert payload.content == RSS_BODY
+    assert len(payload.feed.entries) == 3
+
+
+def test_fetch_rss_feed_returns_empty_on_http_error(rss_requests):
+    assert fetch_rss_feed("erro Niterói") == []
+    assert len(rss_requests) == 1
+
+
+def test_fetch_rss_payload_keeps_raw_body_and_parses_once(rss_requests):
+    payload = fetch_rss_payload("homicídio Niterói", when="1h")
+
+    assert payload.content == RSS_BODY
+    assert payload.content_type == RSS_CONTENT_TYPE
+    assert payload.feed is payload.feed
+    assert payload.feed.encoding == "utf-8"
+    assert payload.feed.headers["content-type"] == RSS_CONTENT_TYPE
+    assert payload.feed.entries[0].link.startswith("https://news.google.com/rss/articles/")
+    assert len(rss_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_fetch_runs_request_off_the_event_loop(monkeypatch):
+    fetch_threads = []
+
+    def fake_fetch(query, when):
+        fetch_threads.append(threading.get_ident())
+        return FeedPayload(url=query, content=RSS_BODY)
+
+    monkeypatch.setattr(ingestion, "fetch_rss_payload", fake_fetch)
+    monkeypatch.setattr(ingestion, "_rate_limiter", ingestion.AsyncRateLimiter(60_000))
+
+    payload = await rate_limited_fetch("Niterói when:1h")
+
+    assert payload.url == "Niterói when:1h"
+    assert fetch_threads and fetch_threads[0] != threading.get_ident()
+
+
+@pytest.fixture(scope="module")
+def feed_entries():
+    """The synthetic RSS_BODY parsed once and shared by the item-structure tests below."""
+    payload = FeedPayload(url=GOOGLE_URL, content=RSS_BODY, content_type=RSS_CONTENT_TYPE)
+    return payload.feed.entries
+
+
+@pytest.mark.parametrize("field", ["title", "link", "id", "published_parsed", "source"])
+def test_feed_items_carry_fields_read_by_ingestion(feed_entries, field):
+    assert all(entry.get(field) for entry in feed_entries)
+
+
+def test_feed_items_link_to_obfuscated_articles(feed_entries):
+    for entry in feed_entries:
+        assert entry.link.startswith("https://news.google.com/rss/articles/")
+        assert entry.source["href"].startswith("https://")
+
+
+def test_feed_titles_split_on_last_separator(feed_entries):
+    assert [parse_headline_and_publisher(entry.title) for entry in feed_entries] == [
+        ("Homem morre baleado na Zona Norte de Niterói", "G1"),
+        ("Polícia investiga morte de jovem no Fonseca", "O São Gonçalo"),
+        ("Tiroteio - Morro do Estado - fecha escolas em Niterói", "Extra"),
+    ]
+
+
+def test_published_at_parsed_from_feed_pubdates(feed_entries):
+    assert [parse_published_at(entry) for entry in feed_entries] == [
+        datetime(2026, 7, 7, 12, 41),
+        datetime(2026, 7, 7, 12, 15),
+        datetime(2026, 7, 7, 11, 58),
+    ]
+    assert parse_published_at({"title": "sem data"}) is None
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Chacina em Maricá - O Globo", ("Chacina em Maricá", "O Globo")),
+        ("Sem veículo informado ", ("Sem veículo informado", None)),
+        ("Operação na Maré - RJ - Extra", ("Operação na Maré - RJ", "Extra")),
+    ],
+    ids=["publisher", "no-separator", "separator-in-headline"],
+)
+def test_parse_headline_and_publisher(title, expected):
+    assert parse_headline_and_publisher(title) == expected
+
+
+def test_concurrent_first_fetches_share_one_client(monkeypatch):
+    created = []
+    real_client = httpx.Client
+
+    def slow_client(**kwargs):
+        # Widen the window between the None check and the assignment.
+        time.sleep(0.01)
+        client = real_client(**kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(ingestion, "_http_client", None)
+    monkeypatch.setattr(ingestion.httpx, "Client", slow_client)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: ingestion.get_http_client(), range(8)))
+    finally:
+        ingestion.close_http_client()
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
@@ -6,7 +6,6 @@ from unittest.mock import patch
 import pytest
 from sqlalchemy import text
 
-from app.models.raw_event import RawEvent
 from app.models.unique_event import UniqueEvent
 from app.services.maintenance import (
     duplicate_group_key,
@@ -65,7 +64,7 @@ class _TestSessionMaker:
 
 
 @pytest.mark.asyncio
-async def test_merge_dry_run_reports_groups(async_session):
+async def test_merge_dry_run_reports_groups(async_session, make_raw_event):
     base = dict(
         title="Homicídio em Juiz de Fora",
         event_date=datetime(2025, 3, 1),
@@ -75,24 +74,11 @@ async def test_merge_dry_run_reports_groups(async_session):
     survivor = UniqueEvent(**base, source_count=3)
     loser = UniqueEvent(**base, source_count=1)
     async_session.add_all([survivor, loser])
-    await async_session.commit()
-    await async_session.refresh(survivor)
-    await async_session.refresh(loser)
+    await async_session.flush()
     survivor_id = survivor.id
     loser_id = loser.id
 
-    async_session.add(
-        RawEvent(
-            title=base["title"],
-            event_date=base["event_date"],
-            city=base["city"],
-            state=base["state"],
-            source_google_news_id=1,
-            unique_event_id=loser_id,
-            deduplication_status="matched",
-        )
-    )
-    await async_session.commit()
+    await make_raw_event(loser)
 
     with patch(
         "app.services.maintenance.async_session_maker",
@@ -111,7 +97,7 @@ async def test_merge_dry_run_reports_groups(async_session):
 
 
 @pytest.mark.asyncio
-async def test_merge_execute_relinks_and_deletes_loser(async_session):
+async def test_merge_execute_relinks_and_deletes_loser(async_session, make_raw_event):
     base = dict(
         title="Tiroteio na Zona Norte",
         event_date=datetime(2025, 6, 10),
@@ -121,32 +107,13 @@ async def test_merge_execute_relinks_and_deletes_loser(async_session):
     survivor = UniqueEvent(**base, source_count=2)
     loser = UniqueEvent(**base, source_count=1)
     async_session.add_all([survivor, loser])
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(survivor)
     await async_session.refresh(loser)
     survivor_id = survivor.id
-    loser_id = loser.id
 
-    raw_on_loser = RawEvent(
-        title=base["title"],
-        event_date=base["event_date"],
-        city=base["city"],
-        state=base["state"],
-        source_google_news_id=1,
-        unique_event_id=loser_id,
-        deduplication_status="matched",
-    )
-    raw_on_survivor = RawEvent(
-        title=base["title"],
-        event_date=base["event_date"],
-        city=base["city"],
-        state=base["state"],
-        source_google_news_id=2,
-        unique_event_id=survivor_id,
-        deduplication_status="matched",
-    )
-    async_session.add_all([raw_on_loser, raw_on_survivor])
-    await async_session.commit()
+    await make_raw_event(loser)
+    await make_raw_event(survivor, source_google_news_id=2)
 
     with patch(
         "app.services.maintenance.async_session_maker",
@@ -195,7 +162,7 @@ async def test_merge_copies_geocoding_when_survivor_lacks_coords(async_session):
         geocoding_source="google_maps",
     )
     async_session.add_all([survivor, loser])
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(survivor)
     await async_session.refresh(loser)
 
@@ -221,7 +188,9 @@ async def test_merge_copies_geocoding_when_survivor_lacks_coords(async_session):
 
 
 @pytest.mark.asyncio
-async def test_merge_by_ids_execute_relinks_and_deletes_loser(async_session):
+async def test_merge_by_ids_execute_relinks_and_deletes_loser(
+    async_session, make_raw_event
+):
     survivor = UniqueEvent(
         title="FEMINICÍDIO - RODOVIA SC-281, SERTÃO DO MARUIM - 06/07/2026",
         event_date=datetime(2026, 7, 6),
@@ -237,24 +206,13 @@ async def test_merge_by_ids_execute_relinks_and_deletes_loser(async_session):
         source_count=2,
     )
     async_session.add_all([survivor, loser])
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(survivor)
     await async_session.refresh(loser)
     survivor_id = survivor.id
     loser_id = loser.id
 
-    async_session.add(
-        RawEvent(
-            title=loser.title,
-            event_date=loser.event_date,
-            city=loser.city,
-            state=loser.state,
-            source_google_news_id=1,
-            unique_event_id=loser_id,
-            deduplication_status="clustered",
-        )
-    )
-    await async_session.commit()
+    await make_raw_event(loser, deduplication_status="clustered")
 
     with patch(
         "app.services.maintenance.async_session_maker",
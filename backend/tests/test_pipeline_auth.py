@@ -1,12 +1,10 @@
 """Tests for pipeline route authentication."""
 
-import os
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.auth import create_access_token, get_password_hash
-from app.main import create_app
 
 
 @pytest.fixture
@@ -20,11 +18,10 @@ def auth_enabled(monkeypatch):
 
 
 @pytest.fixture
-async def auth_client(auth_enabled):
+async def auth_client(auth_enabled, _session_app):
     """Test client with auth enabled."""
-    app = create_app()
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=ASGITransport(app=_session_app),
         base_url="http://test",
     ) as client:
         yield client
@@ -47,6 +44,7 @@ async def test_pipeline_full_requires_auth(auth_client):
     assert response.status_code == 401
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_pipeline_status_with_valid_token(auth_client):
     response = await auth_client.get(
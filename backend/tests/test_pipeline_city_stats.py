@@ -0,0 +1,41 @@
+"""Tests for the /pipeline/city-stats summary."""
+
+import pytest
+
+import app.database as database
+import app.routers.pipeline as pipeline
+from app.models import CityStats
+
+
+class _SessionMaker:
+    def __init__(self, session):
+        self._session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_city_stats_counts_all_cities_but_lists_the_busiest(async_session, monkeypatch):
+    async_session.add_all(
+        [
+            CityStats(city_name="Niterói", last_result_count=40, needs_sharding=False),
+            CityStats(city_name="Rio de Janeiro", last_result_count=100, needs_sharding=True),
+            CityStats(city_name="São Paulo", last_result_count=90, needs_sharding=True),
+        ]
+    )
+    await async_session.flush()
+    monkeypatch.setattr(database, "async_session_maker", _SessionMaker(async_session))
+    monkeypatch.setattr(pipeline, "CITY_STATS_LIMIT", 2)
+
+    summary = await pipeline.get_city_stats()
+
+    assert summary["tracked_cities"] == 3
+    assert summary["sharded_cities"] == 2
+    assert [row["city"] for row in summary["stats"]] == ["Rio de Janeiro", "São Paulo"]
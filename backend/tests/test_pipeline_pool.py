@@ -0,0 +1,47 @@
+"""Tests for the shared ARQ pool behind the pipeline endpoints."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+import app.routers.pipeline as pipeline
+
+
+@pytest.fixture
+def arq_pool(monkeypatch):
+    pool = SimpleNamespace(
+        enqueue_job=AsyncMock(side_effect=lambda name, *args: SimpleNamespace(job_id=f"{name}-1")),
+        close=AsyncMock(),
+    )
+    connect = AsyncMock(return_value=pool)
+    monkeypatch.setattr(pipeline, "_arq_pool", None)
+    monkeypatch.setattr(pipeline, "create_arq_pool", connect)
+    return SimpleNamespace(pool=pool, connect=connect)
+
+
+@pytest.mark.asyncio
+async def test_endpoints_share_one_arq_pool(arq_pool):
+    await pipeline.run_ingestion(query=None, when="1h")
+    await pipeline.run_classify_single(source_id=7)
+
+    assert arq_pool.connect.await_count == 1
+    assert arq_pool.pool.enqueue_job.await_count == 2
+    arq_pool.pool.close.assert_not_awaited()
+
+    await pipeline.close_arq_pool()
+
+    arq_pool.pool.close.assert_awaited_once()
+    assert pipeline._arq_pool is None
+
+
+@pytest.mark.asyncio
+async def test_get_arq_pool_returns_503_and_retries_when_redis_is_down(arq_pool):
+    arq_pool.connect.side_effect = [ConnectionError("refused"), arq_pool.pool]
+
+    with pytest.raises(HTTPException) as excinfo:
+        await pipeline.get_arq_pool()
+
+    assert excinfo.value.status_code == 503
+    assert await pipeline.get_arq_pool() is arq_pool.pool
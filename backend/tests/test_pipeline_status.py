@@ -0,0 +1,39 @@
+"""Tests for the /pipeline/status queue summary."""
+
+import pickle
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from arq.jobs import job_key_prefix, serialize_job
+
+import app.routers.pipeline as pipeline
+
+
+def _payload(function: str) -> bytes:
+    return serialize_job(function, (), {}, None, 1_700_000_000_000, serializer=pickle.dumps)
+
+
+@pytest.mark.asyncio
+async def test_status_counts_whole_queue_but_reads_only_the_head(monkeypatch):
+    pool = SimpleNamespace(
+        default_queue_name="arq:queue",
+        job_deserializer=None,
+        zcard=AsyncMock(return_value=5000),
+        zrange=AsyncMock(return_value=[b"a", b"b", b"c"]),
+        # "b" finished between ZRANGE and MGET.
+        mget=AsyncMock(return_value=[_payload("classify_task"), None, _payload("download_task")]),
+        get=AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr(pipeline, "_arq_pool", pool)
+    monkeypatch.setattr(pipeline, "QUEUED_JOBS_PREVIEW", 3)
+
+    status = await pipeline.collect_pipeline_status()
+
+    pool.zrange.assert_awaited_once_with("arq:queue", 0, 2)
+    pool.mget.assert_awaited_once_with([job_key_prefix + "a", job_key_prefix + "b", job_key_prefix + "c"])
+    assert status["queued_jobs"] == 5000
+    assert [(job["job_id"], job["function"]) for job in status["jobs"]] == [
+        ("a", "classify_task"),
+        ("c", "download_task"),
+    ]
@@ -6,7 +6,6 @@ from decimal import Decimal
 import pytest
 from httpx import AsyncClient
 
-from app.models.raw_event import RawEvent
 from app.models.source_google_news import SourceGoogleNews, SourceStatus
 from app.models.unique_event import UniqueEvent
 
@@ -43,7 +42,7 @@ async def test_public_event_detail_includes_dictionary_fields(
 ):
     event = _base_event()
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(event)
 
     response = await client.get(f"/api/public/events/{event.id}")
@@ -63,17 +62,13 @@ async def test_public_event_detail_includes_dictionary_fields(
 
 @pytest.mark.asyncio
 async def test_public_event_detail_returns_linked_source(
-    app, async_session, client: AsyncClient
+    app, async_session, make_raw_event, client: AsyncClient
 ):
     event = _base_event(source_count=1)
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(event)
     event_id = event.id
-    event_title = event.title
-    event_date = event.event_date
-    event_city = event.city
-    event_state = event.state
 
     source = SourceGoogleNews(
         google_news_id="detail-test-source",
@@ -85,21 +80,10 @@ async def test_public_event_detail_returns_linked_source(
         status=SourceStatus.extracted,
     )
     async_session.add(source)
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(source)
 
-    async_session.add(
-        RawEvent(
-            title=event_title,
-            event_date=event_date,
-            city=event_city,
-            state=event_state,
-            source_google_news_id=source.id,
-            unique_event_id=event_id,
-            deduplication_status="matched",
-        )
-    )
-    await async_session.commit()
+    await make_raw_event(event, source_google_news_id=source.id)
 
     response = await client.get(f"/api/public/events/{event_id}")
 
@@ -114,31 +98,23 @@ async def test_public_event_detail_returns_linked_source(
 
 @pytest.mark.asyncio
 async def test_public_event_detail_returns_raw_fallback_without_source_link(
-    app, async_session, client: AsyncClient
+    app, async_session, make_raw_event, client: AsyncClient
 ):
     event = _base_event(
         title="Evento sem fonte vinculada",
         source_count=1,
     )
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
     await async_session.refresh(event)
     event_id = event.id
-    event_city = event.city
-    event_state = event.state
-
-    async_session.add(
-        RawEvent(
-            title="Matéria extraída sem source_google_news",
-            event_date=datetime(2026, 4, 18, 9, 0, 0),
-            city=event_city,
-            state=event_state,
-            source_google_news_id=None,
-            unique_event_id=event_id,
-            deduplication_status="matched",
-        )
+
+    await make_raw_event(
+        event,
+        title="Matéria extraída sem source_google_news",
+        event_date=datetime(2026, 4, 18, 9, 0, 0),
+        source_google_news_id=None,
     )
-    await async_session.commit()
 
     response = await client.get(f"/api/public/events/{event_id}")
 
@@ -2,13 +2,16 @@
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch
 from httpx import AsyncClient, ASGITransport
 from decimal import Decimal
 
 from app.models.unique_event import UniqueEvent
 from app.taxonomy import parse_legacy_homicide_type
 
+# Future dates only need to be "after now"; computing them once keeps runs deterministic.
+_FUTURE_DATE = datetime.utcnow() + timedelta(days=1)
+_FAR_FUTURE_DATE = datetime.utcnow() + timedelta(days=5)
+
 
 def create_fake_event(
     title: str = None,
@@ -96,7 +99,7 @@ async def test_stats_total_multiple_events(app, async_session):
     async_session.add(event1)
     async_session.add(event2)
     async_session.add(event3)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -127,7 +130,7 @@ async def test_stats_last_7_days_no_events_last_7_days(app, async_session):
     )
     
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -167,7 +170,7 @@ async def test_stats_last_7_days_includes_recent_events(app, async_session):
     
     async_session.add(event_recent1)
     async_session.add(event_recent2)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -188,7 +191,7 @@ async def test_stats_last_7_days_excludes_future_events(app, async_session):
     
     now = datetime.utcnow()
     event_1_day_ago = now - timedelta(days=1)
-    event_future = now + timedelta(days=1)
+    event_future = _FUTURE_DATE
     
     event_recent = UniqueEvent(
         title="Event 1 Day Ago",
@@ -207,7 +210,7 @@ async def test_stats_last_7_days_excludes_future_events(app, async_session):
     
     async_session.add(event_recent)
     async_session.add(event_future_event)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -246,7 +249,7 @@ async def test_stats_last_7_days_excludes_null_event_date(app, async_session):
     
     async_session.add(event_recent)
     async_session.add(event_null)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -286,7 +289,7 @@ async def test_stats_last_7_days_edge_case_boundary(app, async_session):
     
     async_session.add(event_within)
     async_session.add(event_outside)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -336,7 +339,7 @@ async def test_stats_last_7_days_multiple_events(app, async_session):
     async_session.add(event1)
     async_session.add(event2)
     async_session.add(event3)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -368,7 +371,7 @@ async def test_stats_last_30_days_no_events_last_30_days(app, async_session):
     )
     
     async_session.add(event)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -417,7 +420,7 @@ async def test_stats_last_30_days_includes_recent_events(app, async_session):
     async_session.add(event1)
     async_session.add(event2)
     async_session.add(event3)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -438,7 +441,7 @@ async def test_stats_last_30_days_excludes_future_events(app, async_session):
     
     now = datetime.utcnow()
     event_10_days_ago = now - timedelta(days=10)
-    event_future = now + timedelta(days=5)
+    event_future = _FAR_FUTURE_DATE
     
     event_recent = UniqueEvent(
         title="Event 10 Days Ago",
@@ -457,7 +460,7 @@ async def test_stats_last_30_days_excludes_future_events(app, async_session):
     
     async_session.add(event_recent)
     async_session.add(event_future_event)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -496,7 +499,7 @@ async def test_stats_last_30_days_excludes_null_event_date(app, async_session):
     
     async_session.add(event_recent)
     async_session.add(event_null)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -536,7 +539,7 @@ async def test_stats_last_30_days_edge_case_boundary(app, async_session):
     
     async_session.add(event_within)
     async_session.add(event_outside)
-    await async_session.commit()
+    await async_session.flush()
     
     async def override_get_session():
         yield async_session
@@ -687,10 +690,8 @@ async def test_stats_with_multiple_fake_events(app, async_session):
         ),
     ]
     
-    # Add all events to session
-    for event in events:
-        async_session.add(event)
-    await async_session.commit()
+    # Insert all events in one batch; nothing reads their ids back
+    await async_session.run_sync(lambda session: session.bulk_save_objects(events))
     
     async def override_get_session():
         yield async_session
@@ -1,6 +1,7 @@
 """Tests for worker startup recovery helpers."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -9,11 +10,12 @@ from app.tasks.worker import purge_stale_arq_in_progress
 
 @pytest.mark.asyncio
 async def test_purge_stale_arq_in_progress_deletes_matching_keys():
-    redis = AsyncMock()
-    redis.scan = AsyncMock(side_effect=[
-        (0, [b"arq:in-progress:abc", b"arq:in-progress:cron:ingest_cities_hourly:1"]),
-    ])
-    redis.delete = AsyncMock()
+    redis = SimpleNamespace(
+        scan=AsyncMock(side_effect=[
+            (0, [b"arq:in-progress:abc", b"arq:in-progress:cron:ingest_cities_hourly:1"]),
+        ]),
+        delete=AsyncMock(),
+    )
 
     removed = await purge_stale_arq_in_progress(redis)
 
@@ -23,8 +25,7 @@ async def test_purge_stale_arq_in_progress_deletes_matching_keys():
 
 @pytest.mark.asyncio
 async def test_purge_stale_arq_in_progress_no_keys():
-    redis = AsyncMock()
-    redis.scan = AsyncMock(return_value=(0, []))
+    redis = SimpleNamespace(scan=AsyncMock(return_value=(0, [])), delete=AsyncMock())
 
     removed = await purge_stale_arq_in_progress(redis)
 